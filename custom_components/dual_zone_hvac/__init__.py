@@ -71,19 +71,22 @@ TROUBLESHOOTING:
 import logging
 import asyncio
 import time
-from datetime import timedelta
-from typing import Dict, Optional, Literal, Any
+import bisect
+from typing import Dict, Optional, Literal
 from collections import deque
 from dataclasses import dataclass, field
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, State, callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.discovery import async_load_platform
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.const import (
     CONF_NAME,
+    EVENT_HOMEASSISTANT_STOP,
     STATE_UNKNOWN,
     STATE_UNAVAILABLE,
 )
@@ -120,6 +123,7 @@ CONF_UPDATE_INTERVAL = "update_interval"
 CONF_MAX_STARTS_PER_HOUR = "max_starts_per_hour"
 CONF_MIN_COMPRESSOR_RUNTIME = "min_compressor_runtime"
 CONF_MIN_COMPRESSOR_OFF_TIME = "min_compressor_off_time"
+CONF_VERIFY_CLIMATE_CALLS = "verify_climate_calls"
 
 # Default values
 DEFAULT_DEADBAND = 0.5
@@ -130,6 +134,25 @@ DEFAULT_NOMINAL_FAN_SPEED = "medium"
 DEFAULT_MAX_STARTS_PER_HOUR = 3
 DEFAULT_MIN_COMPRESSOR_RUNTIME = 180  # 3 minutes in seconds
 DEFAULT_MIN_COMPRESSOR_OFF_TIME = 180  # 3 minutes in seconds
+DEFAULT_VERIFY_CLIMATE_CALLS = False
+
+# Window for coalescing control requests from rapid UI changes (seconds)
+CONTROL_REQUEST_DELAY = 0.1
+
+# How long to wait for a climate entity to report a requested fan mode (seconds)
+VERIFY_TIMEOUT = 2.0
+
+# Persistent storage
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.state"
+SAVE_DELAY = 10  # Seconds the Store waits before writing, coalescing further saves
+
+# Cooldown used to coalesce bursts of state saves (seconds)
+SAVE_COOLDOWN = 1.0
+
+# Number of most recent samples averaged when learning rates
+RATE_SAMPLE_WINDOW = 5
+LEAKAGE_SAMPLE_WINDOW = 3
 
 # Service names
 SERVICE_SET_TARGET_TEMPERATURE = "set_target_temperature"
@@ -138,6 +161,12 @@ SERVICE_SET_ENABLE = "set_enable"
 SERVICE_RESET_LEARNING = "reset_learning"
 SERVICE_GET_STATE = "get_state"
 
+# ZoneState fields persisted across restarts
+_PERSIST_FIELDS = ('target_setpoint', 'target_temp_low', 'target_temp_high', 'hvac_mode', 'nominal_fan_speed')
+
+# Dispatcher signal sent when a zone's observable state changes (formatted with the zone key)
+SIGNAL_ZONE_UPDATE = f"{DOMAIN}_update_{{}}"
+
 Mode = Literal['heat', 'cool', 'dry', 'fan_only', 'off']
 FanSpeed = Literal['quiet', 'low', 'medium', 'high']
 
@@ -149,6 +178,46 @@ FAN_SPEED_LEVELS = {
     'high': 3
 }
 
+# Modes in which a zone is actively heating or cooling
+_ACTIVE_MODES = frozenset(('heat', 'cool'))
+
+# Climate entity states that carry no usable readings
+_UNAVAILABLE_STATES = frozenset((STATE_UNKNOWN, STATE_UNAVAILABLE))
+
+# Heat_cool mode result indexed by (below range) + 2 * (above range); index 3 can't happen with a valid range
+_HEAT_COOL_MODES = ('fan_only', 'heat', 'cool', 'fan_only')
+
+# Modes that run the compressor
+_COMPRESSOR_MODES = frozenset(('heat', 'cool', 'dry'))
+
+# Mode pairs the shared outdoor unit cannot serve at once.
+# Heat conflicts with cool and with dry (dry typically involves cooling); cool and dry don't conflict.
+_CONFLICT_PAIRS = frozenset((('heat', 'cool'), ('cool', 'heat'), ('heat', 'dry'), ('dry', 'heat')))
+
+# Fan speeds ordered by level
+_FAN_SPEEDS = ('quiet', 'low', 'medium', 'high')
+
+# Boosted fan speed indexed by [error bucket][nominal level]; bucket N boosts N levels, capped at high.
+# Buckets: 0 = error <= 1.5°F, 1 = 1.5-3°F, 2 = 3-5°F, 3 = > 5°F (always high)
+_BOOST_TABLE = tuple(
+    tuple(_FAN_SPEEDS[min(nominal_level + bucket, 3)] for nominal_level in range(4))
+    for bucket in range(4)
+)
+
+# Small-error fan speed indexed by nominal level: lead zones drop 2 levels, lag zones 1, floored at quiet
+_LEAD_REDUCED = tuple(_FAN_SPEEDS[max(nominal_level - 2, 0)] for nominal_level in range(4))
+_LAG_REDUCED = tuple(_FAN_SPEEDS[max(nominal_level - 1, 0)] for nominal_level in range(4))
+
+# Mapping between Home Assistant HVAC modes and internal modes
+_HA_TO_INTERNAL = {
+    HVAC_MODE_HEAT: 'heat',
+    HVAC_MODE_COOL: 'cool',
+    HVAC_MODE_DRY: 'dry',
+    HVAC_MODE_FAN_ONLY: 'fan_only',
+    HVAC_MODE_OFF: 'off',
+}
+_INTERNAL_TO_HA = {mode: ha_mode for ha_mode, mode in _HA_TO_INTERNAL.items()}
+
 # Configuration schema
 ZONE_SCHEMA = vol.Schema({
     vol.Required(CONF_CLIMATE_ENTITY): cv.entity_id,
@@ -156,13 +225,14 @@ ZONE_SCHEMA = vol.Schema({
 })
 
 SETTINGS_SCHEMA = vol.Schema({
-    vol.Optional(CONF_DEADBAND, default=DEFAULT_DEADBAND): vol.Coerce(float),
-    vol.Optional(CONF_MIN_OFFSET, default=DEFAULT_MIN_OFFSET): vol.Coerce(float),
-    vol.Optional(CONF_CONFLICT_THRESHOLD, default=DEFAULT_CONFLICT_THRESHOLD): vol.Coerce(float),
-    vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.Coerce(int),
-    vol.Optional(CONF_MAX_STARTS_PER_HOUR, default=DEFAULT_MAX_STARTS_PER_HOUR): vol.Coerce(int),
-    vol.Optional(CONF_MIN_COMPRESSOR_RUNTIME, default=DEFAULT_MIN_COMPRESSOR_RUNTIME): vol.Coerce(int),
-    vol.Optional(CONF_MIN_COMPRESSOR_OFF_TIME, default=DEFAULT_MIN_COMPRESSOR_OFF_TIME): vol.Coerce(int),
+    vol.Optional(CONF_DEADBAND, default=DEFAULT_DEADBAND): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(CONF_MIN_OFFSET, default=DEFAULT_MIN_OFFSET): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(CONF_CONFLICT_THRESHOLD, default=DEFAULT_CONFLICT_THRESHOLD): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(CONF_MAX_STARTS_PER_HOUR, default=DEFAULT_MAX_STARTS_PER_HOUR): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(CONF_MIN_COMPRESSOR_RUNTIME, default=DEFAULT_MIN_COMPRESSOR_RUNTIME): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(CONF_MIN_COMPRESSOR_OFF_TIME, default=DEFAULT_MIN_COMPRESSOR_OFF_TIME): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional(CONF_VERIFY_CLIMATE_CALLS, default=DEFAULT_VERIFY_CLIMATE_CALLS): cv.boolean,
 })
 
 CONFIG_SCHEMA = vol.Schema({
@@ -174,18 +244,63 @@ CONFIG_SCHEMA = vol.Schema({
 }, extra=vol.ALLOW_EXTRA)
 
 
+class _SampleWindow:
+    """Fixed-size window of rate samples with a running sum"""
+
+    __slots__ = ('_samples', '_total')
+
+    def __init__(self, size: int):
+        self._samples = deque(maxlen=size)
+        self._total = 0.0
+
+    def append(self, sample: float):
+        """Add a sample, evicting the oldest one when the window is full"""
+        if len(self._samples) == self._samples.maxlen:
+            self._total -= self._samples[0]
+        self._samples.append(sample)
+        self._total += sample
+
+    def mean(self) -> float:
+        """Return the average of the samples in the window"""
+        return self._total / len(self._samples)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
 @dataclass
 class ZoneState:
     """Tracks the state and history of a zone"""
-    temperature_history: deque = field(default_factory=lambda: deque(maxlen=10))
-    mode_history: deque = field(default_factory=lambda: deque(maxlen=10))
+    name: str = ""  # Zone key ('zone1' or 'zone2')
+    other: Optional['ZoneState'] = field(default=None, repr=False, compare=False)  # The opposite zone
+    # Only the current and previous readings are used for rate learning
+    temperature_history: deque = field(default_factory=lambda: deque(maxlen=2))
+    mode_history: deque = field(default_factory=lambda: deque(maxlen=2))
     last_mode: str = HVAC_MODE_OFF
     target_setpoint: float = 70.0
     target_temp_high: float = 72.0  # For heat_cool mode
     target_temp_low: float = 68.0   # For heat_cool mode
-    hvac_mode: str = HVAC_MODE_HEAT  # User-selected mode: heat, cool, heat_cool, off
+    hvac_mode: HVACMode = HVAC_MODE_HEAT  # User-selected mode: heat, cool, heat_cool, dry, off
     climate_entity: str = ""
     nominal_fan_speed: str = "medium"  # Changed from max_fan_speed to nominal_fan_speed
+    nominal_fan_level: int = 2  # FAN_SPEED_LEVELS[nominal_fan_speed], kept in sync by the setters
+    # Learned coefficients (°F/min)
+    heating_rate: float = 0.0
+    cooling_rate: float = 0.0
+    leakage_rate: float = 0.0
+    # Recent per-interval temperature changes used to learn the rates above
+    heating_samples: _SampleWindow = field(default_factory=lambda: _SampleWindow(RATE_SAMPLE_WINDOW))
+    cooling_samples: _SampleWindow = field(default_factory=lambda: _SampleWindow(RATE_SAMPLE_WINDOW))
+    leakage_samples: _SampleWindow = field(default_factory=lambda: _SampleWindow(LEAKAGE_SAMPLE_WINDOW))
+
+    def reset_learning(self):
+        """Forget learned rates and the samples they were learned from"""
+        self.heating_rate = 0.0
+        self.cooling_rate = 0.0
+        self.leakage_rate = 0.0
+        self.heating_samples = _SampleWindow(RATE_SAMPLE_WINDOW)
+        self.cooling_samples = _SampleWindow(RATE_SAMPLE_WINDOW)
+        self.leakage_samples = _SampleWindow(LEAKAGE_SAMPLE_WINDOW)
 
 
 class DualZoneHVACController:
@@ -204,6 +319,10 @@ class DualZoneHVACController:
         self.max_starts_per_hour = settings.get(CONF_MAX_STARTS_PER_HOUR, DEFAULT_MAX_STARTS_PER_HOUR)
         self.min_compressor_runtime = settings.get(CONF_MIN_COMPRESSOR_RUNTIME, DEFAULT_MIN_COMPRESSOR_RUNTIME)
         self.min_compressor_off_time = settings.get(CONF_MIN_COMPRESSOR_OFF_TIME, DEFAULT_MIN_COMPRESSOR_OFF_TIME)
+        self.verify_climate_calls = settings.get(CONF_VERIFY_CLIMATE_CALLS, DEFAULT_VERIFY_CLIMATE_CALLS)
+
+        # Converts per-interval temperature changes to °F/min
+        self._per_minute_scale = 60.0 / self.update_interval
 
         # Zone configuration
         zone1_config = config[CONF_ZONE1]
@@ -213,55 +332,104 @@ class DualZoneHVACController:
         initial_temp1 = zone1_config[CONF_TARGET_TEMPERATURE]
         initial_temp2 = zone2_config[CONF_TARGET_TEMPERATURE]
 
-        self.zones = {
-            'zone1': ZoneState(
-                climate_entity=zone1_config[CONF_CLIMATE_ENTITY],
-                target_setpoint=initial_temp1,
-                target_temp_low=initial_temp1 - 2.0,
-                target_temp_high=initial_temp1 + 2.0,
-                hvac_mode=HVAC_MODE_HEAT_COOL,  # Default to auto mode
-                nominal_fan_speed=DEFAULT_NOMINAL_FAN_SPEED
-            ),
-            'zone2': ZoneState(
-                climate_entity=zone2_config[CONF_CLIMATE_ENTITY],
-                target_setpoint=initial_temp2,
-                target_temp_low=initial_temp2 - 2.0,
-                target_temp_high=initial_temp2 + 2.0,
-                hvac_mode=HVAC_MODE_HEAT_COOL,  # Default to auto mode
-                nominal_fan_speed=DEFAULT_NOMINAL_FAN_SPEED
-            )
-        }
-
-        # Learned coefficients
-        self.heating_rate = {'zone1': 0.0, 'zone2': 0.0}
-        self.cooling_rate = {'zone1': 0.0, 'zone2': 0.0}
-        self.leakage_rate = {'zone1': 0.0, 'zone2': 0.0}
-
-        # Tracking for rate calculation
-        self.rate_samples = {
-            'heating': {'zone1': [], 'zone2': []},
-            'cooling': {'zone1': [], 'zone2': []},
-            'leakage': {'zone1': [], 'zone2': []}
+        self.zone1 = ZoneState(
+            name='zone1',
+            climate_entity=zone1_config[CONF_CLIMATE_ENTITY],
+            target_setpoint=initial_temp1,
+            target_temp_low=initial_temp1 - 2.0,
+            target_temp_high=initial_temp1 + 2.0,
+            hvac_mode=HVAC_MODE_HEAT_COOL,  # Default to auto mode
+            nominal_fan_speed=DEFAULT_NOMINAL_FAN_SPEED,
+            nominal_fan_level=FAN_SPEED_LEVELS[DEFAULT_NOMINAL_FAN_SPEED]
+        )
+        self.zone2 = ZoneState(
+            name='zone2',
+            climate_entity=zone2_config[CONF_CLIMATE_ENTITY],
+            target_setpoint=initial_temp2,
+            target_temp_low=initial_temp2 - 2.0,
+            target_temp_high=initial_temp2 + 2.0,
+            hvac_mode=HVAC_MODE_HEAT_COOL,  # Default to auto mode
+            nominal_fan_speed=DEFAULT_NOMINAL_FAN_SPEED,
+            nominal_fan_level=FAN_SPEED_LEVELS[DEFAULT_NOMINAL_FAN_SPEED]
+        )
+        # Link each zone to its neighbour
+        self.zone1.other = self.zone2
+        self.zone2.other = self.zone1
+        # Zones by key, for service calls that name the zone as a string
+        self._zones_by_key = {'zone1': self.zone1, 'zone2': self.zone2}
+        # Dispatcher signal per zone, formatted once since the zones never change
+        self._zone_signals = tuple(SIGNAL_ZONE_UPDATE.format(zone) for zone in self._zones_by_key)
+
+        # Desired-mode handler per user-selected hvac_mode
+        self._mode_dispatch = {
+            HVAC_MODE_OFF: self._desired_off,
+            HVAC_MODE_HEAT_COOL: self._desired_heat_cool,
+            HVAC_MODE_HEAT: self._desired_heat,
+            HVAC_MODE_COOL: self._desired_cool,
+            HVAC_MODE_DRY: self._desired_dry,
         }
 
         self.enabled = True
         self.iteration_count = 0
-        self._cancel_interval = None
+
+        # Event-driven control loop: woken early by service calls, otherwise runs every update_interval
+        self._wake = asyncio.Event()
+        self._control_task: Optional[asyncio.Task] = None
+        # Pending coalesced control request, see async_request_control
+        self._control_request: Optional[asyncio.TimerHandle] = None
 
         # Compressor start tracking for short-cycle prevention
-        self.compressor_start_times = deque(maxlen=20)  # Keep last 20 starts
+        self.compressor_start_times = deque()  # Starts in the last hour, oldest first
+        # List copy of compressor_start_times used for persistence, replaced whenever the deque changes
+        self._starts_list: list = []
         self.compressor_running = False
         self.compressor_last_start_time = None
         self.compressor_last_stop_time = None
 
-        # Climate entities (will be populated by climate platform)
-        self.climate_entities: Dict[str, Any] = {}
+        # Last known states of the physical climate entities, kept current by a state listener
+        self._climate_cache: Dict[str, State] = {}
+        self._cancel_state_listener = None
+        self._cancel_stop_listener = None
+
+        # Pending fan mode verifications: entity_id -> (requested fan mode, future resolved when reported)
+        self._fan_mode_waiters: Dict[str, tuple[str, asyncio.Future]] = {}
+
+        # Sensors ('enabled', 'rates') whose inputs changed since the last save
+        self._dirty_sensors: set = set()
+
+        # Last published sensor states, used to skip redundant state writes
+        self._last_enabled_state: Optional[str] = None
+        self._last_rates_state: Optional[str] = None
+        self._last_rates_attrs: Optional[dict] = None
+
+        # Payload of the last storage write, used to skip saves that would change nothing
+        self._last_saved_payload: Optional[dict] = None
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+
+        # Debounced persistence so bursts of service calls result in a single save
+        self._save_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=SAVE_COOLDOWN,
+            immediate=False,
+            function=self._save_state,
+        )
     
     async def async_setup(self):
         """Set up the controller"""
         # Load persisted state
         await self._load_state()
 
+        # Track state changes of the physical climate entities
+        entity_ids = [self.zone1.climate_entity, self.zone2.climate_entity]
+        for entity_id in entity_ids:
+            state = self.hass.states.get(entity_id)
+            if state is not None:
+                self._climate_cache[entity_id] = state
+        self._cancel_state_listener = async_track_state_change_event(
+            self.hass, entity_ids, self._async_climate_state_changed
+        )
+
         # Load the climate platform to create climate entities
         await async_load_platform(self.hass, 'climate', DOMAIN, {}, self._config)
 
@@ -314,56 +482,126 @@ class DualZoneHVACController:
         await self.async_control_loop()
 
         # Start the periodic control loop
-        self._cancel_interval = async_track_time_interval(
-            self.hass,
-            self.async_control_loop,
-            timedelta(seconds=self.update_interval)
+        self._control_task = self.hass.loop.create_task(self._run_loop())
+
+        # Flush any pending debounced save on shutdown
+        self._cancel_stop_listener = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
         )
 
         _LOGGER.info("Dual Zone HVAC Controller initialized")
-        _LOGGER.info(f"Zone 1: {self.zones['zone1'].climate_entity} -> {self.zones['zone1'].target_setpoint}°F (mode: {self.zones['zone1'].hvac_mode})")
-        _LOGGER.info(f"Zone 2: {self.zones['zone2'].climate_entity} -> {self.zones['zone2'].target_setpoint}°F (mode: {self.zones['zone2'].hvac_mode})")
+        _LOGGER.info(f"Zone 1: {self.zone1.climate_entity} -> {self.zone1.target_setpoint}°F (mode: {self.zone1.hvac_mode})")
+        _LOGGER.info(f"Zone 2: {self.zone2.climate_entity} -> {self.zone2.target_setpoint}°F (mode: {self.zone2.hvac_mode})")
 
         return True
     
+    async def _async_flush_state(self):
+        """Drop any pending debounced or delayed save and persist state now"""
+        self._save_debouncer.async_cancel()
+        try:
+            await self._store.async_save(self._build_write_payload())
+        except Exception as e:
+            _LOGGER.error(f"Could not save state: {e}")
+
+    async def _async_handle_stop(self, event):
+        """Persist state when Home Assistant stops"""
+        self._cancel_stop_listener = None
+        await self._async_flush_state()
+
     async def async_unload(self):
         """Unload the controller"""
-        # Save state before unloading
-        await self._save_state()
-        
-        if self._cancel_interval:
-            self._cancel_interval()
+        await self._async_flush_state()
+
+        if self._cancel_stop_listener:
+            self._cancel_stop_listener()
+            self._cancel_stop_listener = None
+        if self._control_request:
+            self._control_request.cancel()
+            self._control_request = None
+        if self._control_task:
+            self._control_task.cancel()
+            self._control_task = None
+        if self._cancel_state_listener:
+            self._cancel_state_listener()
+            self._cancel_state_listener = None
         return True
+
+    @callback
+    def _async_climate_state_changed(self, event):
+        """Keep the cached state of a physical climate entity current"""
+        entity_id = event.data['entity_id']
+        new_state = event.data.get('new_state')
+        if new_state is None:
+            self._climate_cache.pop(entity_id, None)
+        else:
+            self._climate_cache[entity_id] = new_state
+            self._resolve_fan_mode_waiter(entity_id, new_state)
+
+        # Only a temperature becoming readable again warrants an early control pass (the previous
+        # one may have been skipped); other changes are picked up on the next regular tick
+        if (self._temperature_from_state(event.data.get('old_state')) is None
+                and self._temperature_from_state(new_state) is not None):
+            self._wake.set()
+
+    def _resolve_fan_mode_waiter(self, entity_id: str, state: State):
+        """Resolve a pending fan mode verification if the state reports the requested fan mode"""
+        waiter = self._fan_mode_waiters.get(entity_id)
+        if waiter is None:
+            return
+        expected, future = waiter
+        if not future.done() and state.attributes.get('fan_mode') == expected:
+            future.set_result(None)
+
+    @callback
+    def async_request_control(self):
+        """Request a control pass without waiting for it; requests within CONTROL_REQUEST_DELAY share one pass"""
+        if self._control_request is None:
+            self._control_request = self.hass.loop.call_later(CONTROL_REQUEST_DELAY, self._fire_control_request)
+
+    @callback
+    def _fire_control_request(self):
+        """Wake the control loop once the request window has closed"""
+        # Cleared before the pass runs so requests arriving during it schedule another one
+        self._control_request = None
+        self._wake.set()
+
+    async def _run_loop(self):
+        """Run the control loop every update_interval, or as soon as it is woken"""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.update_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.async_control_loop()
     
     async def _load_state(self):
         """Load persisted state from storage"""
         try:
-            store = Store(self.hass, 1, f"{DOMAIN}.state")
-            data = await store.async_load()
+            data = await self._store.async_load()
             
             if data:
                 # Load zone settings
-                if 'zone1' in data:
-                    self.zones['zone1'].target_setpoint = data['zone1'].get('target_setpoint', self.zones['zone1'].target_setpoint)
-                    self.zones['zone1'].target_temp_low = data['zone1'].get('target_temp_low', self.zones['zone1'].target_temp_low)
-                    self.zones['zone1'].target_temp_high = data['zone1'].get('target_temp_high', self.zones['zone1'].target_temp_high)
-                    self.zones['zone1'].hvac_mode = data['zone1'].get('hvac_mode', self.zones['zone1'].hvac_mode)
-                    self.zones['zone1'].nominal_fan_speed = data['zone1'].get('nominal_fan_speed', self.zones['zone1'].nominal_fan_speed)
-
-                if 'zone2' in data:
-                    self.zones['zone2'].target_setpoint = data['zone2'].get('target_setpoint', self.zones['zone2'].target_setpoint)
-                    self.zones['zone2'].target_temp_low = data['zone2'].get('target_temp_low', self.zones['zone2'].target_temp_low)
-                    self.zones['zone2'].target_temp_high = data['zone2'].get('target_temp_high', self.zones['zone2'].target_temp_high)
-                    self.zones['zone2'].hvac_mode = data['zone2'].get('hvac_mode', self.zones['zone2'].hvac_mode)
-                    self.zones['zone2'].nominal_fan_speed = data['zone2'].get('nominal_fan_speed', self.zones['zone2'].nominal_fan_speed)
+                for key, zone_state in self._zones_by_key.items():
+                    zone_data = data.get(key) or {}
+                    for field_name in _PERSIST_FIELDS:
+                        if field_name in zone_data:
+                            setattr(zone_state, field_name, zone_data[field_name])
+                    zone_state.nominal_fan_level = FAN_SPEED_LEVELS.get(
+                        zone_state.nominal_fan_speed, FAN_SPEED_LEVELS[DEFAULT_NOMINAL_FAN_SPEED]
+                    )
+                    # Persisted as a plain string; keep it as an HVACMode in memory
+                    try:
+                        zone_state.hvac_mode = HVACMode(zone_state.hvac_mode)
+                    except ValueError:
+                        _LOGGER.warning(f"Ignoring unknown persisted HVAC mode for {key}: {zone_state.hvac_mode}")
+                        zone_state.hvac_mode = HVAC_MODE_HEAT_COOL
                 
                 # Load learned rates
-                if 'heating_rate' in data:
-                    self.heating_rate = data['heating_rate']
-                if 'cooling_rate' in data:
-                    self.cooling_rate = data['cooling_rate']
-                if 'leakage_rate' in data:
-                    self.leakage_rate = data['leakage_rate']
+                for rate in ('heating_rate', 'cooling_rate', 'leakage_rate'):
+                    if rate in data:
+                        for key, zone_state in self._zones_by_key.items():
+                            setattr(zone_state, rate, data[rate].get(key, 0.0))
                 
                 # Load enabled state
                 if 'enabled' in data:
@@ -373,148 +611,169 @@ class DualZoneHVACController:
                 if 'compressor_start_times' in data:
                     now = time.time()
                     cutoff = now - 3600  # Only keep starts from last hour
-                    self.compressor_start_times = deque(
-                        (t for t in data['compressor_start_times'] if t > cutoff),
-                        maxlen=20
-                    )
+                    # Starts are saved in the order they happened, so expired ones form a prefix
+                    starts = data['compressor_start_times']
+                    self.compressor_start_times = deque(starts[bisect.bisect_right(starts, cutoff):])
+                    self._starts_list = list(self.compressor_start_times)
                     _LOGGER.info(f"Loaded {len(self.compressor_start_times)} compressor starts from last hour")
 
-                _LOGGER.info(f"Loaded persisted state: Z1={self.zones['zone1'].target_setpoint}°F (fan:{self.zones['zone1'].nominal_fan_speed}), Z2={self.zones['zone2'].target_setpoint}°F (fan:{self.zones['zone2'].nominal_fan_speed})")
+                _LOGGER.info(f"Loaded persisted state: Z1={self.zone1.target_setpoint}°F (fan:{self.zone1.nominal_fan_speed}), Z2={self.zone2.target_setpoint}°F (fan:{self.zone2.nominal_fan_speed})")
         except Exception as e:
             _LOGGER.warning(f"Could not load persisted state: {e}")
     
+    def _build_save_payload(self) -> dict:
+        """Build the data persisted to storage"""
+        data = {
+            key: {field_name: getattr(zone_state, field_name) for field_name in _PERSIST_FIELDS}
+            for key, zone_state in self._zones_by_key.items()
+        }
+        data.update({
+            'heating_rate': self._rates_by_zone('heating_rate'),
+            'cooling_rate': self._rates_by_zone('cooling_rate'),
+            'leakage_rate': self._rates_by_zone('leakage_rate'),
+            'enabled': self.enabled,
+            'compressor_start_times': self._starts_list,
+        })
+        return data
+
+    def _build_write_payload(self) -> dict:
+        """Build the payload for a storage write and remember it as the last written state"""
+        self._last_saved_payload = self._build_save_payload()
+        return self._last_saved_payload
+
     async def _save_state(self):
-        """Save current state to storage"""
+        """Schedule a save of the current state to storage and update sensors"""
         try:
-            store = Store(self.hass, 1, f"{DOMAIN}.state")
-            data = {
-                'zone1': {
-                    'target_setpoint': self.zones['zone1'].target_setpoint,
-                    'target_temp_low': self.zones['zone1'].target_temp_low,
-                    'target_temp_high': self.zones['zone1'].target_temp_high,
-                    'hvac_mode': self.zones['zone1'].hvac_mode,
-                    'nominal_fan_speed': self.zones['zone1'].nominal_fan_speed,
-                },
-                'zone2': {
-                    'target_setpoint': self.zones['zone2'].target_setpoint,
-                    'target_temp_low': self.zones['zone2'].target_temp_low,
-                    'target_temp_high': self.zones['zone2'].target_temp_high,
-                    'hvac_mode': self.zones['zone2'].hvac_mode,
-                    'nominal_fan_speed': self.zones['zone2'].nominal_fan_speed,
-                },
-                'heating_rate': self.heating_rate,
-                'cooling_rate': self.cooling_rate,
-                'leakage_rate': self.leakage_rate,
-                'enabled': self.enabled,
-                'compressor_start_times': list(self.compressor_start_times),
-            }
-            await store.async_save(data)
-            _LOGGER.debug("Saved controller state")
+            # Skip the write entirely if nothing persisted changed since the last one
+            if self._build_save_payload() == self._last_saved_payload:
+                _LOGGER.debug("Controller state unchanged, skipping save")
+            else:
+                # The Store builds the payload and writes it after SAVE_DELAY, and flushes on shutdown
+                self._store.async_delay_save(self._build_write_payload, SAVE_DELAY)
+                _LOGGER.debug("Scheduled controller state save")
             
-            # Update sensor states
-            await self._update_sensors()
+            # Update sensors whose inputs changed
+            dirty, self._dirty_sensors = self._dirty_sensors, set()
+            await self._update_sensors(dirty)
         except Exception as e:
             _LOGGER.error(f"Could not save state: {e}")
     
+    def _rates_by_zone(self, rate: str) -> Dict[str, float]:
+        """Return a learned rate keyed by zone, as persisted and reported by get_state"""
+        return {key: getattr(zone_state, rate) for key, zone_state in self._zones_by_key.items()}
+
+    def _schedule_save(self):
+        """Schedule a debounced save, collapsing bursts of changes into one write"""
+        self.hass.async_create_task(self._save_debouncer.async_call())
+
+    def _build_rates_payload(self) -> tuple[str, dict]:
+        """Build the state and attributes of the learned rates sensor"""
+        z1, z2 = self.zone1, self.zone2
+        h1, h2 = z1.heating_rate, z2.heating_rate
+        c1, c2 = z1.cooling_rate, z2.cooling_rate
+        l1, l2 = z1.leakage_rate, z2.leakage_rate
+        state = 'active' if (h1 > 0 or h2 > 0 or c1 > 0 or c2 > 0 or l1 > 0 or l2 > 0) else 'learning'
+        attrs = {
+            'friendly_name': 'Learned Rates',
+            'zone1_heating_rate': f"{h1:.3f}°F/min",
+            'zone1_cooling_rate': f"{c1:.3f}°F/min",
+            'zone1_leakage_rate': f"{l1:.3f}°F/min",
+            'zone2_heating_rate': f"{h2:.3f}°F/min",
+            'zone2_cooling_rate': f"{c2:.3f}°F/min",
+            'zone2_leakage_rate': f"{l2:.3f}°F/min",
+            'compressor_starts_last_hour': self.count_recent_starts(),
+        }
+        return state, attrs
+
     async def _create_sensors(self):
         """Create sensor entities to expose controller state"""
         # Enabled sensor
+        self._last_enabled_state = 'on' if self.enabled else 'off'
         self.hass.states.async_set(
             f"sensor.{DOMAIN}_enabled",
-            'on' if self.enabled else 'off',
+            self._last_enabled_state,
             {
                 'friendly_name': 'Dual Zone HVAC Enabled',
             }
         )
 
         # Learned rates sensor with diagnostic info
+        self._last_rates_state, self._last_rates_attrs = self._build_rates_payload()
         self.hass.states.async_set(
             f"sensor.{DOMAIN}_learned_rates",
-            'active' if any([
-                self.heating_rate['zone1'] > 0,
-                self.heating_rate['zone2'] > 0,
-                self.cooling_rate['zone1'] > 0,
-                self.cooling_rate['zone2'] > 0,
-                self.leakage_rate['zone1'] > 0,
-                self.leakage_rate['zone2'] > 0
-            ]) else 'learning',
-            {
-                'friendly_name': 'Learned Rates',
-                'zone1_heating_rate': f"{self.heating_rate['zone1']:.3f}°F/min",
-                'zone1_cooling_rate': f"{self.cooling_rate['zone1']:.3f}°F/min",
-                'zone1_leakage_rate': f"{self.leakage_rate['zone1']:.3f}°F/min",
-                'zone2_heating_rate': f"{self.heating_rate['zone2']:.3f}°F/min",
-                'zone2_cooling_rate': f"{self.cooling_rate['zone2']:.3f}°F/min",
-                'zone2_leakage_rate': f"{self.leakage_rate['zone2']:.3f}°F/min",
-                'compressor_starts_last_hour': self.count_recent_starts(),
-            }
+            self._last_rates_state,
+            self._last_rates_attrs
         )
     
-    async def _update_sensors(self):
-        """Update sensor entities with current state"""
+    async def _update_sensors(self, dirty: Optional[set] = None):
+        """
+        Update sensor entities with current state, skipping unchanged ones
+
+        Args:
+            dirty: Sensors to update ('enabled', 'rates'); None updates all of them
+        """
         # Update enabled sensor
-        self.hass.states.async_set(
-            f"sensor.{DOMAIN}_enabled",
-            'on' if self.enabled else 'off',
-            {
-                'friendly_name': 'Dual Zone HVAC Enabled',
-            }
-        )
+        enabled_state = 'on' if self.enabled else 'off'
+        if (dirty is None or 'enabled' in dirty) and enabled_state != self._last_enabled_state:
+            self.hass.states.async_set(
+                f"sensor.{DOMAIN}_enabled",
+                enabled_state,
+                {
+                    'friendly_name': 'Dual Zone HVAC Enabled',
+                }
+            )
+            self._last_enabled_state = enabled_state
 
         # Update learned rates sensor
-        self.hass.states.async_set(
-            f"sensor.{DOMAIN}_learned_rates",
-            'active' if any([
-                self.heating_rate['zone1'] > 0,
-                self.heating_rate['zone2'] > 0,
-                self.cooling_rate['zone1'] > 0,
-                self.cooling_rate['zone2'] > 0,
-                self.leakage_rate['zone1'] > 0,
-                self.leakage_rate['zone2'] > 0
-            ]) else 'learning',
-            {
-                'friendly_name': 'Learned Rates',
-                'zone1_heating_rate': f"{self.heating_rate['zone1']:.3f}°F/min",
-                'zone1_cooling_rate': f"{self.cooling_rate['zone1']:.3f}°F/min",
-                'zone1_leakage_rate': f"{self.leakage_rate['zone1']:.3f}°F/min",
-                'zone2_heating_rate': f"{self.heating_rate['zone2']:.3f}°F/min",
-                'zone2_cooling_rate': f"{self.cooling_rate['zone2']:.3f}°F/min",
-                'zone2_leakage_rate': f"{self.leakage_rate['zone2']:.3f}°F/min",
-                'compressor_starts_last_hour': self.count_recent_starts(),
-            }
-        )
+        if dirty is None or 'rates' in dirty:
+            rates_state, rates_attrs = self._build_rates_payload()
+            if rates_state != self._last_rates_state or rates_attrs != self._last_rates_attrs:
+                self.hass.states.async_set(
+                    f"sensor.{DOMAIN}_learned_rates",
+                    rates_state,
+                    rates_attrs
+                )
+                self._last_rates_state = rates_state
+                self._last_rates_attrs = rates_attrs
 
-        # Update climate entities
-        for entity in self.climate_entities.values():
-            entity.update_state()
+        # Signal both climate entities; each skips its write if unchanged
+        self._notify_zones()
+
+    def _notify_zones(self):
+        """Signal the climate entities; each one skips the state write if nothing it shows changed"""
+        for signal in self._zone_signals:
+            async_dispatcher_send(self.hass, signal)
     
     async def async_set_target_temperature(self, call: ServiceCall):
         """Service to set target temperature for a zone"""
         zone = call.data['zone']
         temperature = call.data['temperature']
-        old_temp = self.zones[zone].target_setpoint
-        self.zones[zone].target_setpoint = temperature
+        zone_state = self._zones_by_key[zone]
+        old_temp = zone_state.target_setpoint
+        zone_state.target_setpoint = temperature
         _LOGGER.info(f"SERVICE CALL: Set {zone} target temperature: {old_temp}°F -> {temperature}°F")
         
-        # Save state after change
-        await self._save_state()
+        # Schedule a debounced save of the change
+        self._schedule_save()
         
-        # Immediately run control loop to apply changes
-        await self.async_control_loop()
+        # Wake the control loop to apply changes
+        self.async_request_control()
     
     async def async_set_nominal_fan_speed(self, call: ServiceCall):
         """Service to set nominal fan speed for a zone"""
         zone = call.data['zone']
         fan_speed = call.data['fan_speed']
-        old_speed = self.zones[zone].nominal_fan_speed
-        self.zones[zone].nominal_fan_speed = fan_speed
+        zone_state = self._zones_by_key[zone]
+        old_speed = zone_state.nominal_fan_speed
+        zone_state.nominal_fan_speed = fan_speed
+        zone_state.nominal_fan_level = FAN_SPEED_LEVELS[fan_speed]
         _LOGGER.info(f"SERVICE CALL: Set {zone} nominal fan speed: {old_speed} -> {fan_speed}")
         
-        # Save state after change
-        await self._save_state()
+        # Schedule a debounced save of the change
+        self._schedule_save()
         
-        # Immediately run control loop to apply changes
-        await self.async_control_loop()
+        # Wake the control loop to apply changes
+        self.async_request_control()
     
     async def async_set_enable(self, call: ServiceCall):
         """Service to enable/disable the controller"""
@@ -522,84 +781,81 @@ class DualZoneHVACController:
         self.enabled = call.data['enabled']
         status = "enabled" if self.enabled else "disabled"
         _LOGGER.warning(f"SERVICE CALL: Controller {status} (was {'enabled' if old_state else 'disabled'})")
+        self._dirty_sensors.add('enabled')
         
-        # Save state after change
-        await self._save_state()
+        # Schedule a debounced save of the change
+        self._schedule_save()
         
-        # If enabling, immediately run control loop
+        # If enabling, wake the control loop
         if self.enabled:
-            await self.async_control_loop()
+            self.async_request_control()
     
     async def async_reset_learning(self, call: ServiceCall):
         """Service to reset learned rates"""
         _LOGGER.warning("SERVICE CALL: Resetting all learned rates")
-        _LOGGER.info(f"Previous rates - Heating: {self.heating_rate}, Cooling: {self.cooling_rate}, Leakage: {self.leakage_rate}")
+        _LOGGER.info(
+            f"Previous rates - Heating: {self._rates_by_zone('heating_rate')}, "
+            f"Cooling: {self._rates_by_zone('cooling_rate')}, Leakage: {self._rates_by_zone('leakage_rate')}"
+        )
         
-        self.heating_rate = {'zone1': 0.0, 'zone2': 0.0}
-        self.cooling_rate = {'zone1': 0.0, 'zone2': 0.0}
-        self.leakage_rate = {'zone1': 0.0, 'zone2': 0.0}
-        self.rate_samples = {
-            'heating': {'zone1': [], 'zone2': []},
-            'cooling': {'zone1': [], 'zone2': []},
-            'leakage': {'zone1': [], 'zone2': []}
-        }
+        for zone_state in self._zones_by_key.values():
+            zone_state.reset_learning()
         _LOGGER.info("All learned rates have been reset to zero")
+        self._dirty_sensors.add('rates')
         
-        # Save state after reset
-        await self._save_state()
+        # Schedule a debounced save of the reset
+        self._schedule_save()
     
     async def async_get_state(self, call: ServiceCall):
         """Service to get current controller state"""
         return {
             'zone1': {
-                'target_setpoint': self.zones['zone1'].target_setpoint,
-                'nominal_fan_speed': self.zones['zone1'].nominal_fan_speed,
+                'target_setpoint': self.zone1.target_setpoint,
+                'nominal_fan_speed': self.zone1.nominal_fan_speed,
             },
             'zone2': {
-                'target_setpoint': self.zones['zone2'].target_setpoint,
-                'nominal_fan_speed': self.zones['zone2'].nominal_fan_speed,
+                'target_setpoint': self.zone2.target_setpoint,
+                'nominal_fan_speed': self.zone2.nominal_fan_speed,
             },
             'enabled': self.enabled,
-            'heating_rate': self.heating_rate,
-            'cooling_rate': self.cooling_rate,
-            'leakage_rate': self.leakage_rate,
+            'heating_rate': self._rates_by_zone('heating_rate'),
+            'cooling_rate': self._rates_by_zone('cooling_rate'),
+            'leakage_rate': self._rates_by_zone('leakage_rate'),
         }
     
-    def _ha_mode_to_internal(self, ha_mode: str) -> Mode:
+    @staticmethod
+    def _ha_mode_to_internal(ha_mode: str) -> Mode:
         """Convert Home Assistant HVAC mode to internal mode"""
-        mapping = {
-            HVAC_MODE_HEAT: 'heat',
-            HVAC_MODE_COOL: 'cool',
-            HVAC_MODE_DRY: 'dry',
-            HVAC_MODE_FAN_ONLY: 'fan_only',
-            HVAC_MODE_OFF: 'off',
-        }
-        return mapping.get(ha_mode, 'off')
+        return _HA_TO_INTERNAL.get(ha_mode, 'off')
 
-    def _internal_mode_to_ha(self, mode: Mode) -> str:
+    @staticmethod
+    def _internal_mode_to_ha(mode: Mode) -> str:
         """Convert internal mode to Home Assistant HVAC mode"""
-        mapping = {
-            'heat': HVAC_MODE_HEAT,
-            'cool': HVAC_MODE_COOL,
-            'dry': HVAC_MODE_DRY,
-            'fan_only': HVAC_MODE_FAN_ONLY,
-            'off': HVAC_MODE_OFF,
-        }
-        return mapping.get(mode, HVAC_MODE_OFF)
+        return _INTERNAL_TO_HA.get(mode, HVAC_MODE_OFF)
     
-    async def _get_climate_temperature(self, entity_id: str) -> Optional[float]:
-        """Get current temperature from climate entity"""
-        state = self.hass.states.get(entity_id)
-        if state is None or state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+    def _get_climate_state(self, entity_id: str) -> Optional[State]:
+        """Get the cached state of a climate entity, falling back to the state machine before it is cached"""
+        state = self._climate_cache.get(entity_id)
+        if state is None:
+            state = self.hass.states.get(entity_id)
+        return state
+
+    @staticmethod
+    def _temperature_from_state(state: Optional[State]) -> Optional[float]:
+        """Extract the current temperature from a climate state, or None if it is unavailable"""
+        if state is None or state.state in _UNAVAILABLE_STATES:
             return None
-        
         temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE)
         return float(temp) if temp is not None else None
+
+    async def _get_climate_temperature(self, entity_id: str) -> Optional[float]:
+        """Get current temperature from climate entity"""
+        return self._temperature_from_state(self._get_climate_state(entity_id))
     
     async def _get_climate_mode(self, entity_id: str) -> str:
         """Get current HVAC mode from climate entity"""
-        state = self.hass.states.get(entity_id)
-        if state is None or state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+        state = self._get_climate_state(entity_id)
+        if state is None or state.state in _UNAVAILABLE_STATES:
             return HVAC_MODE_OFF
         return state.state
     
@@ -617,33 +873,36 @@ class DualZoneHVACController:
     
     async def _set_climate_mode(self, entity_id: str, mode: str = None, fan_speed: str = None):
         """Set HVAC mode and/or fan speed for climate entity"""
-        _LOGGER.debug(f"Setting {entity_id}: mode={mode}, fan_speed={fan_speed}")
-        
-        # Check current state before making changes
-        state = self.hass.states.get(entity_id)
-        if state:
-            current_fan_mode = state.attributes.get('fan_mode')
-            _LOGGER.debug(f"{entity_id} current fan_mode: {current_fan_mode}")
-        
-        # Set HVAC mode if specified (blocking to ensure it completes before fan mode change)
-        if mode is not None:
-            await self.hass.services.async_call(
-                'climate',
-                'set_hvac_mode',
-                {
-                    'entity_id': entity_id,
-                    'hvac_mode': mode,
-                },
-                blocking=True
-            )
-            # Small delay to allow mode change to fully propagate
-            await asyncio.sleep(0.2)
-        
-        # Set fan mode if specified
-        # The climate entity expects: 'low', 'medium', 'high', 'quiet' (all lowercase)
-        if fan_speed is not None:
-            _LOGGER.info(f"Calling climate.set_fan_mode for {entity_id} with fan_mode='{fan_speed}'")
-            try:
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            state = self._climate_cache.get(entity_id)
+            current_fan_mode = state.attributes.get('fan_mode') if state else None
+            _LOGGER.debug("Setting %s: mode=%s, fan_speed=%s (current fan_mode: %s)", entity_id, mode, fan_speed, current_fan_mode)
+
+        # Optionally confirm the fan mode change through the state listener
+        verification = None
+        if self.verify_climate_calls and fan_speed is not None:
+            verification = self.hass.loop.create_future()
+            self._fan_mode_waiters[entity_id] = (fan_speed, verification)
+
+        # Resulting state changes arrive through the state listener
+        try:
+            # Set HVAC mode if specified
+            # (blocking to ensure it completes before fan mode change)
+            if mode is not None:
+                await self.hass.services.async_call(
+                    'climate',
+                    'set_hvac_mode',
+                    {
+                        'entity_id': entity_id,
+                        'hvac_mode': mode,
+                    },
+                    blocking=True
+                )
+
+            # Set fan mode if specified
+            # The climate entity expects: 'low', 'medium', 'high', 'quiet' (all lowercase)
+            if fan_speed is not None:
+                _LOGGER.info("Calling climate.set_fan_mode for %s with fan_mode='%s'", entity_id, fan_speed)
                 await self.hass.services.async_call(
                     'climate',
                     'set_fan_mode',
@@ -651,27 +910,41 @@ class DualZoneHVACController:
                         'entity_id': entity_id,
                         'fan_mode': fan_speed,
                     },
-                    blocking=True  # Wait for the call to complete
+                    blocking=True
                 )
-                
-                # Check if it actually changed (give more time for state to update)
-                await asyncio.sleep(1.0)  # Wait for state to propagate
-                state_after = self.hass.states.get(entity_id)
-                if state_after:
-                    new_fan_mode = state_after.attributes.get('fan_mode')
-                    _LOGGER.info(f"{entity_id} fan_mode after call: {new_fan_mode} (requested: {fan_speed})")
-                    if new_fan_mode != fan_speed:
-                        _LOGGER.warning(f"{entity_id} fan mode did not change as expected! Current mode: {state_after.state}")
-            except Exception as e:
-                _LOGGER.error(f"Failed to set fan mode for {entity_id}: {e}", exc_info=True)
+
+            if verification is not None:
+                # The entity may already have been in the requested fan mode
+                state = self._climate_cache.get(entity_id)
+                if state is not None:
+                    self._resolve_fan_mode_waiter(entity_id, state)
+                try:
+                    await asyncio.wait_for(verification, timeout=VERIFY_TIMEOUT)
+                    _LOGGER.debug("%s fan_mode confirmed: %s", entity_id, fan_speed)
+                except asyncio.TimeoutError:
+                    state = self._climate_cache.get(entity_id)
+                    _LOGGER.warning(
+                        "%s fan mode did not change as expected! Current fan_mode: %s (requested: %s)",
+                        entity_id, state.attributes.get('fan_mode') if state else None, fan_speed
+                    )
+        except Exception as e:
+            _LOGGER.error("Failed to set mode/fan mode for %s: %s", entity_id, e, exc_info=True)
+        finally:
+            if verification is not None:
+                self._fan_mode_waiters.pop(entity_id, None)
     
-    def calculate_optimal_fan_speed(self, zone: str, mode: Mode,
+    async def _apply_zone_controls(self, entity_id: str, mode: str, fan_speed: str, temperature: float):
+        """Apply mode, fan speed and setpoint to one zone's climate entity"""
+        await self._set_climate_mode(entity_id, mode, fan_speed)
+        await self._set_climate_temperature(entity_id, temperature)
+
+    def calculate_optimal_fan_speed(self, zone_state: ZoneState, mode: Mode,
                                     temp_error: float, is_lead: bool, other_zone_mode: Mode = 'off') -> FanSpeed:
         """
         Calculate optimal fan speed based on mode and conditions
 
         Args:
-            zone: Zone identifier
+            zone_state: Zone being controlled
             mode: Current HVAC mode
             temp_error: Absolute temperature error from target
             is_lead: Whether this zone will reach target first
@@ -680,18 +953,18 @@ class DualZoneHVACController:
         Returns:
             Optimal fan speed
         """
-        nominal_speed = self.zones[zone].nominal_fan_speed
-        nominal_level = FAN_SPEED_LEVELS[nominal_speed]
+        nominal_speed = zone_state.nominal_fan_speed
+        nominal_level = zone_state.nominal_fan_level
 
         # Fan only mode - behavior depends on whether other zone is actively conditioning
         if mode == 'fan_only':
             # If other zone is actively heating/cooling, use quiet to minimize leakage impact
-            if other_zone_mode in ['heat', 'cool']:
-                _LOGGER.debug(f"{zone}: fan_only with other zone {other_zone_mode} - using quiet to minimize leakage")
+            if other_zone_mode in _ACTIVE_MODES:
+                _LOGGER.debug("%s: fan_only with other zone %s - using quiet to minimize leakage", zone_state.name, other_zone_mode)
                 return 'quiet'
             # If other zone is also fan_only/off, no leakage concern - use nominal for circulation
             else:
-                _LOGGER.debug(f"{zone}: fan_only with other zone {other_zone_mode} - using nominal for circulation")
+                _LOGGER.debug("%s: fan_only with other zone %s - using nominal for circulation", zone_state.name, other_zone_mode)
                 return nominal_speed
         
         # Off mode - quiet fan
@@ -699,128 +972,110 @@ class DualZoneHVACController:
             return 'quiet'
         
         # Active heating/cooling - modulate around nominal speed
-        if mode in ['heat', 'cool']:
-            # Very large error (>5°F) - always boost to high for maximum performance
-            if temp_error > 5.0:
-                _LOGGER.debug(f"{zone}: Very large error ({temp_error:.1f}°F) - boosting to high")
-                return 'high'
-            
-            # Large error (>3°F) - boost aggressively (can go from quiet -> high)
-            elif temp_error > 3.0:
-                # Boost 2 levels above nominal, capped at high
-                boost_level = min(nominal_level + 2, 3)
-                speed_options = ['quiet', 'low', 'medium', 'high']
-                speed = speed_options[boost_level]
-                if speed != nominal_speed:
-                    _LOGGER.debug(f"{zone}: Large error ({temp_error:.1f}°F) - boosting from {nominal_speed} to {speed}")
-                return speed
-            
-            # Medium error (1.5-3°F) - boost one level above nominal
-            elif temp_error > 1.5:
-                boost_level = min(nominal_level + 1, 3)
-                speed_options = ['quiet', 'low', 'medium', 'high']
-                speed = speed_options[boost_level]
+        if mode in _ACTIVE_MODES:
+            # Medium error and above - boost above nominal (>5°F always goes to high)
+            bucket = (temp_error > 1.5) + (temp_error > 3.0) + (temp_error > 5.0)
+            if bucket:
+                speed = _BOOST_TABLE[bucket][nominal_level]
                 if speed != nominal_speed:
-                    _LOGGER.debug(f"{zone}: Medium error ({temp_error:.1f}°F) - boosting from {nominal_speed} to {speed}")
+                    _LOGGER.debug("%s: Error %.1f°F - boosting from %s to %s", zone_state.name, temp_error, nominal_speed, speed)
                 return speed
-            
+
             # Small error (<1.5°F) - modulate around nominal to avoid overshoot
+            # Lead zone should reduce more aggressively to prevent overshoot
+            if is_lead:
+                # Very close to target - drop to quiet
+                if temp_error < 0.5:
+                    _LOGGER.debug("%s: Very small error (%.1f°F), lead zone - dropping to quiet", zone_state.name, temp_error)
+                    return 'quiet'
+                # Drop 2 levels below nominal to slow approach
+                speed = _LEAD_REDUCED[nominal_level]
+                _LOGGER.debug("%s: Small error (%.1f°F), lead zone - reducing from %s to %s", zone_state.name, temp_error, nominal_speed, speed)
+                return speed
             else:
-                # Lead zone should reduce more aggressively to prevent overshoot
-                if is_lead:
-                    # Very close to target - drop to quiet
-                    if temp_error < 0.5:
-                        _LOGGER.debug(f"{zone}: Very small error ({temp_error:.1f}°F), lead zone - dropping to quiet")
-                        return 'quiet'
-                    # Drop 2 levels below nominal to slow approach
-                    reduce_level = max(nominal_level - 2, 0)
-                    speed_options = ['quiet', 'low', 'medium', 'high']
-                    speed = speed_options[reduce_level]
-                    _LOGGER.debug(f"{zone}: Small error ({temp_error:.1f}°F), lead zone - reducing from {nominal_speed} to {speed}")
-                    return speed
-                else:
-                    # Lag zone can stay at or slightly below nominal to catch up
-                    reduce_level = max(nominal_level - 1, 0)
-                    speed_options = ['quiet', 'low', 'medium', 'high']
-                    speed = speed_options[reduce_level]
-                    if speed != nominal_speed:
-                        _LOGGER.debug(f"{zone}: Small error ({temp_error:.1f}°F), lag zone - reducing from {nominal_speed} to {speed}")
-                    return speed
+                # Lag zone can stay at or slightly below nominal to catch up
+                speed = _LAG_REDUCED[nominal_level]
+                if speed != nominal_speed:
+                    _LOGGER.debug("%s: Small error (%.1f°F), lag zone - reducing from %s to %s", zone_state.name, temp_error, nominal_speed, speed)
+                return speed
         
         return nominal_speed
     
-    def determine_desired_mode(self, zone: str, current_temp: float, deadband_override: float = None) -> Mode:
+    def determine_desired_mode(self, zone_state: ZoneState, current_temp: float, deadband_override: float = None) -> Mode:
         """Determine what mode is needed based on current temp, user-selected hvac_mode, and target setpoints"""
         deadband = deadband_override if deadband_override is not None else self.deadband
-        zone_state = self.zones[zone]
-        hvac_mode = zone_state.hvac_mode
-
-        # If OFF mode selected, return off
-        if hvac_mode == HVAC_MODE_OFF:
-            return 'off'
-
-        # For heat_cool (auto) mode, use temperature range
-        # Note: The range itself IS the deadband, don't add extra deadband on top
-        if hvac_mode == HVAC_MODE_HEAT_COOL:
-            temp_low = zone_state.target_temp_low
-            temp_high = zone_state.target_temp_high
-
-            # Too cold - need heating
-            if current_temp < temp_low:
-                return 'heat'
-            # Too hot - need cooling
-            elif current_temp > temp_high:
-                return 'cool'
-            # Within range - just fan
-            else:
-                return 'fan_only'
-
-        # For heat-only mode
-        elif hvac_mode == HVAC_MODE_HEAT:
-            target = zone_state.target_setpoint
-            error = target - current_temp
 
-            if error > deadband:
-                return 'heat'
-            else:
-                return 'fan_only'
+        handler = self._mode_dispatch.get(zone_state.hvac_mode)
+        if handler is None:
+            # Default to fan_only
+            return 'fan_only'
+        return handler(zone_state, current_temp, deadband)
 
-        # For cool-only mode
-        elif hvac_mode == HVAC_MODE_COOL:
-            target = zone_state.target_setpoint
-            error = target - current_temp
+    @staticmethod
+    def _desired_off(zone_state: ZoneState, current_temp: float, deadband: float) -> Mode:
+        """OFF mode selected - zone is off"""
+        return 'off'
 
-            if error < -deadband:
-                return 'cool'
-            else:
-                return 'fan_only'
-
-        # For dry (dehumidification) mode
-        elif hvac_mode == HVAC_MODE_DRY:
-            # Dry mode runs to dehumidify regardless of temperature
-            # Only switch to fan_only if temperature gets too far off target
-            target = zone_state.target_setpoint
-            error = abs(target - current_temp)
-
-            # If temperature is within reasonable range, use dry mode
-            if error < 5.0:  # Within 5°F of target
-                return 'dry'
-            else:
-                # Temperature too far off, switch to fan_only to avoid over-cooling
-                return 'fan_only'
+    @staticmethod
+    def _desired_heat_cool(zone_state: ZoneState, current_temp: float, deadband: float) -> Mode:
+        """Heat_cool (auto) mode - condition towards the temperature range"""
+        # Note: The range itself IS the deadband, don't add extra deadband on top
+        # Index 1 = too cold (heat), 2 = too hot (cool), 0 = within range (fan only)
+        return _HEAT_COOL_MODES[
+            (current_temp < zone_state.target_temp_low) + 2 * (current_temp > zone_state.target_temp_high)
+        ]
+
+    @staticmethod
+    def _desired_heat(zone_state: ZoneState, current_temp: float, deadband: float) -> Mode:
+        """Heat-only mode - heat when below setpoint by more than the deadband"""
+        if zone_state.target_setpoint - current_temp > deadband:
+            return 'heat'
+        else:
+            return 'fan_only'
 
-        # Default to fan_only
-        return 'fan_only'
+    @staticmethod
+    def _desired_cool(zone_state: ZoneState, current_temp: float, deadband: float) -> Mode:
+        """Cool-only mode - cool when above setpoint by more than the deadband"""
+        if zone_state.target_setpoint - current_temp < -deadband:
+            return 'cool'
+        else:
+            return 'fan_only'
+
+    @staticmethod
+    def _desired_dry(zone_state: ZoneState, current_temp: float, deadband: float) -> Mode:
+        """Dry (dehumidification) mode"""
+        # Dry mode runs to dehumidify regardless of temperature
+        # Only switch to fan_only if temperature gets too far off target
+        # If temperature is within reasonable range (5°F of target), use dry mode
+        if abs(zone_state.target_setpoint - current_temp) < 5.0:
+            return 'dry'
+        else:
+            # Temperature too far off, switch to fan_only to avoid over-cooling
+            return 'fan_only'
 
-    def count_recent_starts(self) -> int:
-        """Count compressor starts in the last hour"""
-        now = time.time()
+    def _prune_starts(self, now: float):
+        """Drop compressor starts older than one hour from the front of the start deque"""
         cutoff = now - 3600  # 60 minutes ago
-        return sum(1 for t in self.compressor_start_times if t > cutoff)
+        starts = self.compressor_start_times
+        if starts and starts[0] <= cutoff:
+            while starts and starts[0] <= cutoff:
+                starts.popleft()
+            self._starts_list = list(starts)
+
+    def _record_start(self, start_time: float):
+        """Record a compressor start"""
+        self._prune_starts(start_time)
+        self.compressor_start_times.append(start_time)
+        self._starts_list = list(self.compressor_start_times)
+
+    def count_recent_starts(self, now: Optional[float] = None) -> int:
+        """Count compressor starts in the last hour"""
+        self._prune_starts(time.time() if now is None else now)
+        return len(self.compressor_start_times)
 
-    def get_dynamic_deadband(self) -> float:
+    def get_dynamic_deadband(self, now: Optional[float] = None) -> float:
         """Calculate deadband based on recent compressor starts to prevent short cycling"""
-        recent_starts = self.count_recent_starts()
+        recent_starts = self.count_recent_starts(now)
 
         if recent_starts >= self.max_starts_per_hour:
             # At or over limit - expand deadband to prevent another start
@@ -837,16 +1092,14 @@ class DualZoneHVACController:
 
     def is_compressor_running(self, mode1: Mode, mode2: Mode) -> bool:
         """Check if compressor is running (either zone in heat/cool/dry)"""
-        return mode1 in ['heat', 'cool', 'dry'] or mode2 in ['heat', 'cool', 'dry']
+        return mode1 in _COMPRESSOR_MODES or mode2 in _COMPRESSOR_MODES
 
-    def enforce_minimum_runtime(self, mode1: Mode, mode2: Mode) -> tuple[Mode, Mode]:
+    def enforce_minimum_runtime(self, mode1: Mode, mode2: Mode, now: float) -> tuple[Mode, Mode]:
         """
         Enforce 3-minute rule: minimum runtime and minimum off-time
 
         Returns modified modes that comply with timing constraints
         """
-        now = time.time()
-
         # Check if desired modes would start the compressor
         would_start = self.is_compressor_running(mode1, mode2) and not self.compressor_running
 
@@ -878,9 +1131,9 @@ class DualZoneHVACController:
                 )
                 # Keep compressor running by returning the previous modes
                 # that were keeping it in heat/cool
-                prev_mode1 = self.zones['zone1'].last_mode
-                prev_mode2 = self.zones['zone2'].last_mode
-                _LOGGER.debug(f"Overriding to previous modes: Zone1={prev_mode1}, Zone2={prev_mode2}")
+                prev_mode1 = self.zone1.last_mode
+                prev_mode2 = self.zone2.last_mode
+                _LOGGER.debug("Overriding to previous modes: Zone1=%s, Zone2=%s", prev_mode1, prev_mode2)
                 return prev_mode1, prev_mode2
 
         # No timing constraints violated
@@ -888,104 +1141,97 @@ class DualZoneHVACController:
 
     def modes_conflict(self, mode1: Mode, mode2: Mode) -> bool:
         """Check if two modes conflict"""
-        # Heat and cool conflict
-        if (mode1 == 'heat' and mode2 == 'cool') or (mode1 == 'cool' and mode2 == 'heat'):
-            return True
-        # Heat and dry conflict (dry typically involves cooling)
-        if (mode1 == 'heat' and mode2 == 'dry') or (mode1 == 'dry' and mode2 == 'heat'):
-            return True
-        # Cool and dry don't conflict (both cool)
-        return False
+        return (mode1, mode2) in _CONFLICT_PAIRS
     
-    def update_temperature_history(self, zone: str, temp: float, mode: Mode):
+    def update_temperature_history(self, state: ZoneState, temp: float, mode: Mode):
         """Update history and calculate rates of change"""
-        state = self.zones[zone]
         state.temperature_history.append(temp)
         state.mode_history.append(mode)
         
         if len(state.temperature_history) < 2:
             return
         
+        # Both histories are appended together, so mode_history also holds a previous entry
         temp_change = state.temperature_history[-1] - state.temperature_history[-2]
-        prev_mode = state.mode_history[-2] if len(state.mode_history) >= 2 else mode
+        prev_mode = state.mode_history[-2]
         
-        other_zone = 'zone2' if zone == 'zone1' else 'zone1'
-        other_mode = self.zones[other_zone].last_mode
+        zone = state.name
+        other_mode = state.other.last_mode
         
-        _LOGGER.debug(f"{zone}: temp_change={temp_change:.3f}°F, prev_mode={prev_mode}, other_mode={other_mode}")
+        _LOGGER.debug("%s: temp_change=%.3f°F, prev_mode=%s, other_mode=%s", zone, temp_change, prev_mode, other_mode)
         
         # Active heating/cooling rate
         if prev_mode == 'heat' and temp_change > 0:
-            self.rate_samples['heating'][zone].append(temp_change)
-            _LOGGER.debug(f"{zone}: Recording heating sample: {temp_change:.3f}°F")
-            self._update_rate(zone, 'heating')
+            state.heating_samples.append(temp_change)
+            _LOGGER.debug("%s: Recording heating sample: %.3f°F", zone, temp_change)
+            self._update_rate(state, 'heating')
         elif prev_mode == 'cool' and temp_change < 0:
-            self.rate_samples['cooling'][zone].append(abs(temp_change))
-            _LOGGER.debug(f"{zone}: Recording cooling sample: {abs(temp_change):.3f}°F")
-            self._update_rate(zone, 'cooling')
+            state.cooling_samples.append(abs(temp_change))
+            _LOGGER.debug("%s: Recording cooling sample: %.3f°F", zone, abs(temp_change))
+            self._update_rate(state, 'cooling')
         
         # Leakage rate
-        elif prev_mode == 'fan_only' and other_mode in ['heat', 'cool']:
+        elif prev_mode == 'fan_only' and other_mode in _ACTIVE_MODES:
             if abs(temp_change) > 0.05:
-                self.rate_samples['leakage'][zone].append(abs(temp_change))
-                _LOGGER.debug(f"{zone}: Recording leakage sample: {abs(temp_change):.3f}°F (other zone in {other_mode})")
-                self._update_leakage_rate(zone)
+                state.leakage_samples.append(abs(temp_change))
+                _LOGGER.debug("%s: Recording leakage sample: %.3f°F (other zone in %s)", zone, abs(temp_change), other_mode)
+                self._update_leakage_rate(state)
     
-    def _update_rate(self, zone: str, rate_type: str):
+    def _update_rate(self, zone_state: ZoneState, rate_type: str):
         """Update heating or cooling rate using exponential moving average"""
-        samples = self.rate_samples[rate_type][zone]
+        samples = zone_state.heating_samples if rate_type == 'heating' else zone_state.cooling_samples
         if len(samples) >= 3:
-            recent = samples[-5:]
-            avg_rate = sum(recent) / len(recent)
+            # Window only holds the most recent RATE_SAMPLE_WINDOW samples
+            avg_rate = samples.mean()
             
             # Convert to per-minute rate (samples are per update_interval)
-            avg_rate = avg_rate * (60.0 / self.update_interval)
+            avg_rate = avg_rate * self._per_minute_scale
             
-            old_rate = self.heating_rate[zone] if rate_type == 'heating' else self.cooling_rate[zone]
+            zone = zone_state.name
             
             if rate_type == 'heating':
-                if self.heating_rate[zone] == 0:
-                    self.heating_rate[zone] = avg_rate
+                old_rate = zone_state.heating_rate
+                if old_rate == 0:
+                    zone_state.heating_rate = avg_rate
                     _LOGGER.info(f"{zone}: Initial heating rate learned: {avg_rate:.3f}°F/min")
                 else:
-                    self.heating_rate[zone] = 0.7 * self.heating_rate[zone] + 0.3 * avg_rate
-                    _LOGGER.debug(f"{zone}: Heating rate updated: {old_rate:.3f} -> {self.heating_rate[zone]:.3f}°F/min")
+                    zone_state.heating_rate = 0.7 * old_rate + 0.3 * avg_rate
+                    _LOGGER.debug("%s: Heating rate updated: %.3f -> %.3f°F/min", zone, old_rate, zone_state.heating_rate)
             elif rate_type == 'cooling':
-                if self.cooling_rate[zone] == 0:
-                    self.cooling_rate[zone] = avg_rate
+                old_rate = zone_state.cooling_rate
+                if old_rate == 0:
+                    zone_state.cooling_rate = avg_rate
                     _LOGGER.info(f"{zone}: Initial cooling rate learned: {avg_rate:.3f}°F/min")
                 else:
-                    self.cooling_rate[zone] = 0.7 * self.cooling_rate[zone] + 0.3 * avg_rate
-                    _LOGGER.debug(f"{zone}: Cooling rate updated: {old_rate:.3f} -> {self.cooling_rate[zone]:.3f}°F/min")
+                    zone_state.cooling_rate = 0.7 * old_rate + 0.3 * avg_rate
+                    _LOGGER.debug("%s: Cooling rate updated: %.3f -> %.3f°F/min", zone, old_rate, zone_state.cooling_rate)
     
-    def _update_leakage_rate(self, zone: str):
+    def _update_leakage_rate(self, zone_state: ZoneState):
         """Update leakage rate"""
-        samples = self.rate_samples['leakage'][zone]
+        samples = zone_state.leakage_samples
         if len(samples) >= 2:
-            recent = samples[-3:]
-            avg_rate = sum(recent) / len(recent)
+            # Window only holds the most recent LEAKAGE_SAMPLE_WINDOW samples
+            avg_rate = samples.mean()
             
             # Convert to per-minute rate
-            avg_rate = avg_rate * (60.0 / self.update_interval)
+            avg_rate = avg_rate * self._per_minute_scale
             
-            old_rate = self.leakage_rate[zone]
+            zone = zone_state.name
+            old_rate = zone_state.leakage_rate
             
-            if self.leakage_rate[zone] == 0:
-                self.leakage_rate[zone] = avg_rate
+            if old_rate == 0:
+                zone_state.leakage_rate = avg_rate
                 _LOGGER.info(f"{zone}: Initial leakage rate learned: {avg_rate:.3f}°F/min")
             else:
-                self.leakage_rate[zone] = 0.7 * self.leakage_rate[zone] + 0.3 * avg_rate
-                _LOGGER.debug(f"{zone}: Leakage rate updated: {old_rate:.3f} -> {self.leakage_rate[zone]:.3f}°F/min")
+                zone_state.leakage_rate = 0.7 * old_rate + 0.3 * avg_rate
+                _LOGGER.debug("%s: Leakage rate updated: %.3f -> %.3f°F/min", zone, old_rate, zone_state.leakage_rate)
     
-    def calculate_time_to_target(self, zone: str, current_temp: float,
-                                 target_temp: float, mode: Mode) -> float:
-        """Estimate time to reach target temperature in minutes"""
-        error = abs(target_temp - current_temp)
-        
+    def calculate_time_to_target(self, zone_state: ZoneState, error: float, mode: Mode) -> float:
+        """Estimate time to reach target temperature in minutes, given the absolute temperature error"""
         if mode == 'heat':
-            rate = self.heating_rate[zone]
+            rate = zone_state.heating_rate
         elif mode == 'cool':
-            rate = self.cooling_rate[zone]
+            rate = zone_state.cooling_rate
         else:
             return float('inf')
         
@@ -994,13 +1240,13 @@ class DualZoneHVACController:
         
         return error / rate
     
-    def calculate_compensation_offset(self, lead_zone: str, lag_zone: str,
+    def calculate_compensation_offset(self, lead_zone: ZoneState, lag_zone: ZoneState,
                                      time_diff: float, mode: Mode) -> float:
         """Calculate the setpoint offset to compensate for leakage"""
         if time_diff <= 0:
             return 0.0
         
-        leakage = self.leakage_rate[lead_zone]
+        leakage = lead_zone.leakage_rate
         
         if leakage < 0.01:
             leakage = 0.15  # Conservative default
@@ -1011,165 +1257,164 @@ class DualZoneHVACController:
         
         return offset
     
-    async def async_control_loop(self, now=None):
+    def _resolve_zone_ordering(self, z1: ZoneState, z2: ZoneState, error1_abs: float, error2_abs: float,
+                               target1: float, target2: float,
+                               mode1: Mode, mode2: Mode) -> tuple[float, float, bool, bool]:
+        """
+        Determine the lead zone and apply leakage compensation in a single pass
+
+        Returns (internal_setpoint1, internal_setpoint2, is_lead_zone1, is_lead_zone2)
+        """
+        active1 = mode1 in _ACTIVE_MODES
+        active2 = mode2 in _ACTIVE_MODES
+
+        if active1 and not active2:
+            # Only zone1 is actively conditioning
+            _LOGGER.debug("Zone1 is lead zone (only active zone)")
+            return target1, target2, True, False
+        if active2 and not active1:
+            # Only zone2 is actively conditioning
+            _LOGGER.debug("Zone2 is lead zone (only active zone)")
+            return target1, target2, False, True
+        if not active1:
+            _LOGGER.debug("No compensation needed - modes: %s, %s", mode1, mode2)
+            return target1, target2, False, False
+
+        # Both zones active - determine lead based on time to target
+        time1 = self.calculate_time_to_target(z1, error1_abs, mode1)
+        time2 = self.calculate_time_to_target(z2, error2_abs, mode2)
+        _LOGGER.debug("Time to target: Zone1=%.1fmin, Zone2=%.1fmin", time1, time2)
+
+        # Leakage compensation only applies when both zones need the same conditioning mode
+        compensate = mode1 == mode2
+
+        if time1 < time2 and time1 != float('inf'):
+            _LOGGER.debug("Zone1 is lead zone")
+            if not compensate:
+                return target1, target2, True, False
+            time_diff = time2 - time1
+            offset = self.calculate_compensation_offset(z1, z2, time_diff, mode1)
+            internal_setpoint1 = target1 - offset if mode1 == 'heat' else target1 + offset
+            _LOGGER.info("LEAKAGE COMPENSATION: Zone1 is lead by %.1fmin, applying offset of %.2f°F", time_diff, offset)
+            _LOGGER.debug("Zone1 internal setpoint adjusted: %s°F -> %.2f°F", target1, internal_setpoint1)
+            return internal_setpoint1, target2, True, False
+
+        if time2 < time1 and time2 != float('inf'):
+            _LOGGER.debug("Zone2 is lead zone")
+            if not compensate:
+                return target1, target2, False, True
+            time_diff = time1 - time2
+            offset = self.calculate_compensation_offset(z2, z1, time_diff, mode2)
+            internal_setpoint2 = target2 - offset if mode2 == 'heat' else target2 + offset
+            _LOGGER.info("LEAKAGE COMPENSATION: Zone2 is lead by %.1fmin, applying offset of %.2f°F", time_diff, offset)
+            _LOGGER.debug("Zone2 internal setpoint adjusted: %s°F -> %.2f°F", target2, internal_setpoint2)
+            return target1, internal_setpoint2, False, True
+
+        _LOGGER.debug("No leakage compensation needed (times equal or unknown)")
+        return target1, target2, False, False
+
+    async def async_control_loop(self):
         """Main control loop called at fixed interval"""
         if not self.enabled:
             _LOGGER.debug("Control loop skipped - controller disabled")
             return
         
         self.iteration_count += 1
-        _LOGGER.debug(f"=== Control Loop Iteration {self.iteration_count} ===")
+        # Checked once per tick so debug-only work is skipped entirely in production
+        debug_on = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_on:
+            _LOGGER.debug("=== Control Loop Iteration %s ===", self.iteration_count)
+        now = time.time()
+        z1, z2 = self.zone1, self.zone2
+        c1, c2 = z1.climate_entity, z2.climate_entity
         
         try:
             # Read current temperatures
-            t1 = await self._get_climate_temperature(self.zones['zone1'].climate_entity)
-            t2 = await self._get_climate_temperature(self.zones['zone2'].climate_entity)
+            t1 = await self._get_climate_temperature(c1)
+            t2 = await self._get_climate_temperature(c2)
             
             if t1 is None or t2 is None:
                 _LOGGER.warning("Unable to read temperatures from climate entities")
                 return
             
-            _LOGGER.debug(f"Current temperatures: Zone1={t1}°F, Zone2={t2}°F")
+            if debug_on:
+                _LOGGER.debug("Current temperatures: Zone1=%s°F, Zone2=%s°F", t1, t2)
             
             # Get current modes
-            current_ha_mode1 = await self._get_climate_mode(self.zones['zone1'].climate_entity)
-            current_ha_mode2 = await self._get_climate_mode(self.zones['zone2'].climate_entity)
+            current_ha_mode1 = await self._get_climate_mode(c1)
+            current_ha_mode2 = await self._get_climate_mode(c2)
             
             current_mode1 = self._ha_mode_to_internal(current_ha_mode1)
             current_mode2 = self._ha_mode_to_internal(current_ha_mode2)
             
-            _LOGGER.debug(f"Current modes: Zone1={current_mode1}, Zone2={current_mode2}")
+            if debug_on:
+                _LOGGER.debug("Current modes: Zone1=%s, Zone2=%s", current_mode1, current_mode2)
             
             # Get target setpoints
-            target1 = self.zones['zone1'].target_setpoint
-            target2 = self.zones['zone2'].target_setpoint
+            target1 = z1.target_setpoint
+            target2 = z2.target_setpoint
             
-            _LOGGER.debug(f"Target setpoints: Zone1={target1}°F, Zone2={target2}°F")
+            if debug_on:
+                _LOGGER.debug("Target setpoints: Zone1=%s°F, Zone2=%s°F", target1, target2)
+
+            # Temperature errors, reused for conflict resolution, lead-zone timing and fan speeds
+            error1 = target1 - t1
+            error2 = target2 - t2
+            error1_abs = abs(error1)
+            error2_abs = abs(error2)
             
             # Update histories
-            self.update_temperature_history('zone1', t1, current_mode1)
-            self.update_temperature_history('zone2', t2, current_mode2)
+            self.update_temperature_history(z1, t1, current_mode1)
+            self.update_temperature_history(z2, t2, current_mode2)
 
             # Get dynamic deadband for short-cycle prevention
-            dynamic_deadband = self.get_dynamic_deadband()
-            if dynamic_deadband != self.deadband:
-                _LOGGER.debug(f"Using dynamic deadband: {dynamic_deadband:.1f}°F (normal: {self.deadband:.1f}°F)")
+            dynamic_deadband = self.get_dynamic_deadband(now)
+            if debug_on and dynamic_deadband != self.deadband:
+                _LOGGER.debug("Using dynamic deadband: %.1f°F (normal: %.1f°F)", dynamic_deadband, self.deadband)
 
             # Determine desired modes using dynamic deadband and user-selected hvac_mode
-            desired_mode1 = self.determine_desired_mode('zone1', t1, dynamic_deadband)
-            desired_mode2 = self.determine_desired_mode('zone2', t2, dynamic_deadband)
+            desired_mode1 = self.determine_desired_mode(z1, t1, dynamic_deadband)
+            desired_mode2 = self.determine_desired_mode(z2, t2, dynamic_deadband)
 
-            error1 = target1 - t1
-            error2 = target2 - t2
-
-            _LOGGER.debug(f"Temperature errors: Zone1={error1:.2f}°F, Zone2={error2:.2f}°F")
-            _LOGGER.debug(f"Desired modes: Zone1={desired_mode1}, Zone2={desired_mode2}")
+            if debug_on:
+                _LOGGER.debug("Temperature errors: Zone1=%.2f°F, Zone2=%.2f°F", error1, error2)
+                _LOGGER.debug("Desired modes: Zone1=%s, Zone2=%s", desired_mode1, desired_mode2)
             
             # Initialize fan speeds to None
             fan_speed1 = None
             fan_speed2 = None
-            
+
             # Handle mode conflicts
             if self.modes_conflict(desired_mode1, desired_mode2):
-                _LOGGER.info(f"MODE CONFLICT DETECTED: Zone1 wants {desired_mode1}, Zone2 wants {desired_mode2}")
-                error1_abs = abs(target1 - t1)
-                error2_abs = abs(target2 - t2)
+                _LOGGER.info("MODE CONFLICT DETECTED: Zone1 wants %s, Zone2 wants %s", desired_mode1, desired_mode2)
                 
                 if error1_abs > error2_abs + self.conflict_threshold:
                     mode1, mode2 = desired_mode1, 'fan_only'
-                    internal_setpoint1, internal_setpoint2 = target1, target2
-                    _LOGGER.info(f"CONFLICT RESOLUTION: Prioritizing Zone1 (error {error1_abs:.2f}°F > {error2_abs:.2f}°F + {self.conflict_threshold}°F)")
+                    _LOGGER.info("CONFLICT RESOLUTION: Prioritizing Zone1 (error %.2f°F > %.2f°F + %s°F)", error1_abs, error2_abs, self.conflict_threshold)
                 elif error2_abs > error1_abs + self.conflict_threshold:
                     mode1, mode2 = 'fan_only', desired_mode2
-                    internal_setpoint1, internal_setpoint2 = target1, target2
-                    _LOGGER.info(f"CONFLICT RESOLUTION: Prioritizing Zone2 (error {error2_abs:.2f}°F > {error1_abs:.2f}°F + {self.conflict_threshold}°F)")
+                    _LOGGER.info("CONFLICT RESOLUTION: Prioritizing Zone2 (error %.2f°F > %.2f°F + %s°F)", error2_abs, error1_abs, self.conflict_threshold)
                 else:
                     mode1, mode2 = 'fan_only', 'fan_only'
-                    internal_setpoint1, internal_setpoint2 = target1, target2
-                    _LOGGER.info(f"CONFLICT RESOLUTION: Both zones to fan_only (errors too close: {error1_abs:.2f}°F vs {error2_abs:.2f}°F)")
-            
-            # Both need same conditioning mode
-            elif desired_mode1 == desired_mode2 and desired_mode1 in ['heat', 'cool']:
-                mode1 = desired_mode1
-                mode2 = desired_mode2
-                
-                time1 = self.calculate_time_to_target('zone1', t1, target1, mode1)
-                time2 = self.calculate_time_to_target('zone2', t2, target2, mode2)
-                
-                _LOGGER.debug(f"Time to target: Zone1={time1:.1f}min, Zone2={time2:.1f}min")
-                
-                if time1 < time2 and time1 != float('inf'):
-                    time_diff = time2 - time1
-                    offset = self.calculate_compensation_offset('zone1', 'zone2', time_diff, mode1)
-                    
-                    if mode1 == 'heat':
-                        internal_setpoint1 = target1 - offset
-                    else:
-                        internal_setpoint1 = target1 + offset
-                    internal_setpoint2 = target2
-                    
-                    _LOGGER.info(f"LEAKAGE COMPENSATION: Zone1 is lead by {time_diff:.1f}min, applying offset of {offset:.2f}°F")
-                    _LOGGER.debug(f"Zone1 internal setpoint adjusted: {target1}°F -> {internal_setpoint1:.2f}°F")
-                    
-                elif time2 < time1 and time2 != float('inf'):
-                    time_diff = time1 - time2
-                    offset = self.calculate_compensation_offset('zone2', 'zone1', time_diff, mode2)
-                    
-                    internal_setpoint1 = target1
-                    if mode2 == 'heat':
-                        internal_setpoint2 = target2 - offset
-                    else:
-                        internal_setpoint2 = target2 + offset
-                    
-                    _LOGGER.info(f"LEAKAGE COMPENSATION: Zone2 is lead by {time_diff:.1f}min, applying offset of {offset:.2f}°F")
-                    _LOGGER.debug(f"Zone2 internal setpoint adjusted: {target2}°F -> {internal_setpoint2:.2f}°F")
-                else:
-                    internal_setpoint1 = target1
-                    internal_setpoint2 = target2
-                    _LOGGER.debug("No leakage compensation needed (times equal or unknown)")
-            
+                    _LOGGER.info("CONFLICT RESOLUTION: Both zones to fan_only (errors too close: %.2f°F vs %.2f°F)", error1_abs, error2_abs)
             else:
                 mode1 = desired_mode1
                 mode2 = desired_mode2
-                internal_setpoint1 = target1
-                internal_setpoint2 = target2
-                _LOGGER.debug(f"No compensation needed - modes: {mode1}, {mode2}")
 
             # Enforce 3-minute rule: minimum runtime and off-time
-            mode1, mode2 = self.enforce_minimum_runtime(mode1, mode2)
-
-            # Determine which zone is lead (will reach target first)
-            is_lead_zone1 = False
-            is_lead_zone2 = False
-
-            if mode1 in ['heat', 'cool'] and mode2 in ['heat', 'cool']:
-                # Both zones active - determine lead based on time to target
-                time1 = self.calculate_time_to_target('zone1', t1, target1, mode1)
-                time2 = self.calculate_time_to_target('zone2', t2, target2, mode2)
-
-                if time1 < time2 and time1 != float('inf'):
-                    is_lead_zone1 = True
-                    _LOGGER.debug("Zone1 is lead zone")
-                elif time2 < time1 and time2 != float('inf'):
-                    is_lead_zone2 = True
-                    _LOGGER.debug("Zone2 is lead zone")
-            elif mode1 in ['heat', 'cool'] and mode2 not in ['heat', 'cool']:
-                # Only zone1 is actively conditioning
-                is_lead_zone1 = True
-                _LOGGER.debug("Zone1 is lead zone (only active zone)")
-            elif mode2 in ['heat', 'cool'] and mode1 not in ['heat', 'cool']:
-                # Only zone2 is actively conditioning
-                is_lead_zone2 = True
-                _LOGGER.debug("Zone2 is lead zone (only active zone)")
+            mode1, mode2 = self.enforce_minimum_runtime(mode1, mode2, now)
 
-            # Calculate optimal fan speeds based on mode, error, lead/lag status, and other zone's mode
-            error1_abs = abs(target1 - t1)
-            error2_abs = abs(target2 - t2)
+            # Determine which zone is lead (will reach target first) and compensate for leakage
+            internal_setpoint1, internal_setpoint2, is_lead_zone1, is_lead_zone2 = self._resolve_zone_ordering(
+                z1, z2, error1_abs, error2_abs, target1, target2, mode1, mode2
+            )
 
-            fan_speed1 = self.calculate_optimal_fan_speed('zone1', mode1, error1_abs, is_lead_zone1, mode2)
-            fan_speed2 = self.calculate_optimal_fan_speed('zone2', mode2, error2_abs, is_lead_zone2, mode1)
+            # Calculate optimal fan speeds based on mode, error, lead/lag status, and other zone's mode
+            fan_speed1 = self.calculate_optimal_fan_speed(z1, mode1, error1_abs, is_lead_zone1, mode2)
+            fan_speed2 = self.calculate_optimal_fan_speed(z2, mode2, error2_abs, is_lead_zone2, mode1)
 
-            _LOGGER.debug(f"Calculated fan speeds: Zone1={fan_speed1} (lead={is_lead_zone1}, error={error1_abs:.1f}°F, other_mode={mode2}), Zone2={fan_speed2} (lead={is_lead_zone2}, error={error2_abs:.1f}°F, other_mode={mode1})")
+            if debug_on:
+                _LOGGER.debug("Calculated fan speeds: Zone1=%s (lead=%s, error=%.1f°F, other_mode=%s), Zone2=%s (lead=%s, error=%.1f°F, other_mode=%s)", fan_speed1, is_lead_zone1, error1_abs, mode2, fan_speed2, is_lead_zone2, error2_abs, mode1)
 
             # Apply control actions
             ha_mode1 = self._internal_mode_to_ha(mode1)
@@ -1182,34 +1427,36 @@ class DualZoneHVACController:
             if mode_changed1 or mode_changed2:
                 _LOGGER.info(f"APPLYING MODE CHANGES: Zone1: {current_ha_mode1} -> {ha_mode1}, Zone2: {current_ha_mode2} -> {ha_mode2}")
             
-            _LOGGER.info(f"SETTING CONTROLS: Zone1: mode={ha_mode1}, fan={fan_speed1}, setpoint={internal_setpoint1:.1f}°F | Zone2: mode={ha_mode2}, fan={fan_speed2}, setpoint={internal_setpoint2:.1f}°F")
+            _LOGGER.info(
+                "SETTING CONTROLS: Zone1: mode=%s, fan=%s, setpoint=%.1f°F | Zone2: mode=%s, fan=%s, setpoint=%.1f°F",
+                ha_mode1, fan_speed1, internal_setpoint1, ha_mode2, fan_speed2, internal_setpoint2
+            )
             
-            await self._set_climate_mode(self.zones['zone1'].climate_entity, ha_mode1, fan_speed1)
-            await self._set_climate_mode(self.zones['zone2'].climate_entity, ha_mode2, fan_speed2)
-            await self._set_climate_temperature(self.zones['zone1'].climate_entity, internal_setpoint1)
-            await self._set_climate_temperature(self.zones['zone2'].climate_entity, internal_setpoint2)
+            # Zones are written concurrently; within a zone the mode is applied before the setpoint
+            await asyncio.gather(
+                self._apply_zone_controls(c1, ha_mode1, fan_speed1, internal_setpoint1),
+                self._apply_zone_controls(c2, ha_mode2, fan_speed2, internal_setpoint2),
+            )
             
             # Update state
-            self.zones['zone1'].last_mode = mode1
-            self.zones['zone2'].last_mode = mode2
+            z1.last_mode = mode1
+            z2.last_mode = mode2
 
             # Track compressor starts for short-cycle prevention
             new_compressor_state = self.is_compressor_running(mode1, mode2)
             if new_compressor_state and not self.compressor_running:
                 # Compressor just started
-                start_time = time.time()
-                self.compressor_start_times.append(start_time)
-                self.compressor_last_start_time = start_time
-                recent_starts = self.count_recent_starts()
+                self._record_start(now)
+                self.compressor_last_start_time = now
+                recent_starts = self.count_recent_starts(now)
                 _LOGGER.warning(
                     f"COMPRESSOR START detected. Total starts in last hour: {recent_starts}"
                 )
             elif not new_compressor_state and self.compressor_running:
                 # Compressor just stopped
-                stop_time = time.time()
-                self.compressor_last_stop_time = stop_time
+                self.compressor_last_stop_time = now
                 if self.compressor_last_start_time:
-                    runtime = stop_time - self.compressor_last_start_time
+                    runtime = now - self.compressor_last_start_time
                     _LOGGER.info(f"Compressor stopped after {runtime:.0f}s runtime")
                 else:
                     _LOGGER.info("Compressor stopped")
@@ -1218,15 +1465,16 @@ class DualZoneHVACController:
 
             # Log status summary every cycle
             _LOGGER.info(
-                f"STATUS: Z1[{t1:.1f}°F->{internal_setpoint1:.1f}°F ({mode1})] Z2[{t2:.1f}°F->{internal_setpoint2:.1f}°F ({mode2})] | "
-                f"Rates: H[{self.heating_rate['zone1']:.3f},{self.heating_rate['zone2']:.3f}] "
-                f"C[{self.cooling_rate['zone1']:.3f},{self.cooling_rate['zone2']:.3f}] "
-                f"L[{self.leakage_rate['zone1']:.3f},{self.leakage_rate['zone2']:.3f}]"
+                "STATUS: Z1[%.1f°F->%.1f°F (%s)] Z2[%.1f°F->%.1f°F (%s)] | "
+                "Rates: H[%.3f,%.3f] C[%.3f,%.3f] L[%.3f,%.3f]",
+                t1, internal_setpoint1, mode1, t2, internal_setpoint2, mode2,
+                z1.heating_rate, z2.heating_rate,
+                z1.cooling_rate, z2.cooling_rate,
+                z1.leakage_rate, z2.leakage_rate
             )
 
-            # Update climate entity states
-            for entity in self.climate_entities.values():
-                entity.update_state()
+            # Refresh the learned rates sensor and signal both climate entities; each skips its write if unchanged
+            await self._update_sensors({'rates'})
 
         except Exception as e:
             _LOGGER.error(f"Error in control loop: {e}", exc_info=True)
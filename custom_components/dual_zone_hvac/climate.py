@@ -2,24 +2,33 @@
 import logging
 from typing import Optional, Dict, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.const import STATE_UNKNOWN, STATE_UNAVAILABLE, UnitOfTemperature, ATTR_TEMPERATURE
+from homeassistant.const import UnitOfTemperature, ATTR_TEMPERATURE
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
     HVACMode,
-    ATTR_CURRENT_TEMPERATURE,
     ATTR_TARGET_TEMP_HIGH,
     ATTR_TARGET_TEMP_LOW,
     ATTR_HVAC_MODE,
 )
 
-from . import DOMAIN, DualZoneHVACController
+from . import DOMAIN, FAN_SPEED_LEVELS, SIGNAL_ZONE_UPDATE, DualZoneHVACController
 
 _LOGGER = logging.getLogger(__name__)
 
+# Setpoints closer than this are treated as unchanged
+TEMPERATURE_EPSILON = 1e-3
+
+
+def _same_temperature(a: Optional[float], b: Optional[float]) -> bool:
+    """Check whether two setpoints are equal within TEMPERATURE_EPSILON"""
+    return a is not None and b is not None and abs(a - b) < TEMPERATURE_EPSILON
+
 
 async def async_setup_platform(
     hass: HomeAssistant,
@@ -31,14 +40,10 @@ async def async_setup_platform(
     controller: DualZoneHVACController = hass.data[DOMAIN]
 
     entities = [
-        DualZoneClimate(hass, controller, 'zone1', 'Zone 1', controller.zones['zone1'].climate_entity),
-        DualZoneClimate(hass, controller, 'zone2', 'Zone 2', controller.zones['zone2'].climate_entity),
+        DualZoneClimate(hass, controller, 'zone1', 'Zone 1', controller.zone1.climate_entity),
+        DualZoneClimate(hass, controller, 'zone2', 'Zone 2', controller.zone2.climate_entity),
     ]
 
-    # Store references in controller
-    controller.climate_entities['zone1'] = entities[0]
-    controller.climate_entities['zone2'] = entities[1]
-
     async_add_entities(entities)
     _LOGGER.info("Climate entities registered: climate.dual_zone_hvac_zone1, climate.dual_zone_hvac_zone2")
 
@@ -52,8 +57,17 @@ class DualZoneClimate(ClimateEntity):
         self.hass = hass
         self._controller = controller
         self._zone_id = zone_id
+        # The controller's zone states live as long as the controller, so resolve ours once
+        self._zone = controller._zones_by_key[zone_id]
         self._zone_name = zone_name
         self._physical_entity = physical_entity
+        # Current temperature of the physical entity, kept up to date by a state listener
+        self._attr_current_temperature = None
+        # Formatted extra_state_attributes and the zone values they were built from
+        self._attrs_key: Optional[tuple] = None
+        self._attrs: Dict[str, Any] = {}
+        # Observable state at the last state write, see _async_write_state_if_changed
+        self._last_signature: Optional[tuple] = None
         self._attr_name = f"Dual Zone HVAC {zone_name}"
         self._attr_unique_id = f"{DOMAIN}_{zone_id}"
         self._attr_should_poll = False
@@ -73,81 +87,79 @@ class DualZoneClimate(ClimateEntity):
         # Supported fan modes
         self._attr_fan_modes = ['quiet', 'low', 'medium', 'high']
 
-    @property
-    def supported_features(self) -> int:
-        """Return the list of supported features - changes based on HVAC mode"""
-        # Base features always include fan mode
-        features = ClimateEntityFeature.FAN_MODE
+        # Supported features depend on the HVAC mode; updated when the mode changes
+        self._attr_supported_features = self._features_for_mode(self._zone.hvac_mode)
 
-        # Add temperature control features based on current mode
-        current_mode = self._controller.zones[self._zone_id].hvac_mode
-
-        if current_mode == HVACMode.HEAT_COOL:
+    @staticmethod
+    def _features_for_mode(hvac_mode: str) -> ClimateEntityFeature:
+        """Return the supported features for an HVAC mode"""
+        # Base features always include fan mode
+        if hvac_mode == HVACMode.HEAT_COOL:
             # Heat/Cool mode supports temperature range
-            features |= ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-        else:
-            # Heat, Cool, Dry, or Off modes support single temperature
-            features |= ClimateEntityFeature.TARGET_TEMPERATURE
-
-        return features
-
-    @property
-    def current_temperature(self) -> Optional[float]:
-        """Return the current temperature from the physical climate entity"""
-        state = self.hass.states.get(self._physical_entity)
-        if state is None or state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
-            return None
-        return state.attributes.get(ATTR_CURRENT_TEMPERATURE)
+            return ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+        # Heat, Cool, Dry, or Off modes support single temperature
+        return ClimateEntityFeature.FAN_MODE | ClimateEntityFeature.TARGET_TEMPERATURE
 
     @property
     def target_temperature(self) -> Optional[float]:
         """Return the target temperature from controller state"""
         # For heat/cool modes, return the single setpoint
         # For heat_cool mode, this represents the midpoint
-        return self._controller.zones[self._zone_id].target_setpoint
+        return self._zone.target_setpoint
 
     @property
     def target_temperature_high(self) -> Optional[float]:
         """Return the high target temperature for heat_cool mode"""
-        return self._controller.zones[self._zone_id].target_temp_high
+        return self._zone.target_temp_high
 
     @property
     def target_temperature_low(self) -> Optional[float]:
         """Return the low target temperature for heat_cool mode"""
-        return self._controller.zones[self._zone_id].target_temp_low
+        return self._zone.target_temp_low
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return the user-selected HVAC mode"""
-        return HVACMode(self._controller.zones[self._zone_id].hvac_mode)
+        return self._zone.hvac_mode
 
     @property
     def fan_mode(self) -> Optional[str]:
         """Return the nominal fan speed setting for this zone"""
-        return self._controller.zones[self._zone_id].nominal_fan_speed
+        return self._zone.nominal_fan_speed
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes"""
-        zone = self._controller.zones[self._zone_id]
-        return {
-            'heating_rate': f"{self._controller.heating_rate[self._zone_id]:.3f}°F/min",
-            'cooling_rate': f"{self._controller.cooling_rate[self._zone_id]:.3f}°F/min",
-            'leakage_rate': f"{self._controller.leakage_rate[self._zone_id]:.3f}°F/min",
-            'physical_entity': self._physical_entity,
-            'hvac_mode': zone.hvac_mode,
-            'target_temp_range': f"{zone.target_temp_low:.1f}-{zone.target_temp_high:.1f}°F",
-        }
+        zone = self._zone
+        # Only reformat when one of the underlying values changed
+        key = (zone.heating_rate, zone.cooling_rate, zone.leakage_rate,
+               zone.hvac_mode, zone.target_temp_low, zone.target_temp_high)
+        if key != self._attrs_key:
+            self._attrs_key = key
+            self._attrs = {
+                'heating_rate': f"{zone.heating_rate:.3f}°F/min",
+                'cooling_rate': f"{zone.cooling_rate:.3f}°F/min",
+                'leakage_rate': f"{zone.leakage_rate:.3f}°F/min",
+                'physical_entity': self._physical_entity,
+                'hvac_mode': zone.hvac_mode,
+                'target_temp_range': f"{zone.target_temp_low:.1f}-{zone.target_temp_high:.1f}°F",
+            }
+        return self._attrs
 
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature or temperature range"""
-        zone = self._controller.zones[self._zone_id]
+        zone = self._zone
+        zone_id = self._zone_id
+        changed = False
 
-        # Handle temperature range (for heat_cool mode)
-        if ATTR_TARGET_TEMP_HIGH in kwargs and ATTR_TARGET_TEMP_LOW in kwargs:
-            temp_high = float(kwargs[ATTR_TARGET_TEMP_HIGH])
-            temp_low = float(kwargs[ATTR_TARGET_TEMP_LOW])
+        # The climate service schema has already coerced these to floats
+        temp_high = kwargs.get(ATTR_TARGET_TEMP_HIGH)
+        temp_low = kwargs.get(ATTR_TARGET_TEMP_LOW)
+        temperature = kwargs.get(ATTR_TEMPERATURE)
+        hvac_mode = kwargs.get(ATTR_HVAC_MODE)
 
+        # Handle temperature range (for heat_cool mode)
+        if temp_high is not None and temp_low is not None:
             # Ensure minimum range width to prevent rapid cycling
             # Minimum should be at least 2x deadband for effective operation
             min_range = max(self._controller.deadband * 2, 1.0)
@@ -159,72 +171,148 @@ class DualZoneClimate(ClimateEntity):
                 temp_low = midpoint - (min_range / 2.0)
                 temp_high = midpoint + (min_range / 2.0)
                 _LOGGER.warning(
-                    f"{self._zone_id}: Temperature range too narrow ({current_range:.1f}°F), "
-                    f"expanded to {min_range:.1f}°F minimum: {temp_low:.1f}-{temp_high:.1f}°F"
+                    "%s: Temperature range too narrow (%.1f°F), expanded to %.1f°F minimum: %.1f-%.1f°F",
+                    zone_id, current_range, min_range, temp_low, temp_high
                 )
 
             old_high = zone.target_temp_high
             old_low = zone.target_temp_low
 
-            zone.target_temp_high = temp_high
-            zone.target_temp_low = temp_low
-            # Update midpoint setpoint
-            zone.target_setpoint = (temp_high + temp_low) / 2.0
-
-            _LOGGER.info(
-                f"Set {self._zone_id} temperature range: "
-                f"{old_low:.1f}-{old_high:.1f}°F -> {temp_low:.1f}-{temp_high:.1f}°F"
-            )
+            if _same_temperature(temp_high, old_high) and _same_temperature(temp_low, old_low):
+                _LOGGER.debug("%s: Temperature range unchanged", zone_id)
+            else:
+                changed = True
+                zone.target_temp_high = temp_high
+                zone.target_temp_low = temp_low
+                # Update midpoint setpoint
+                zone.target_setpoint = (temp_high + temp_low) / 2.0
+
+                _LOGGER.info(
+                    "Set %s temperature range: %.1f-%.1f°F -> %.1f-%.1f°F",
+                    zone_id, old_low, old_high, temp_low, temp_high
+                )
 
         # Handle single temperature (for heat/cool modes)
-        elif ATTR_TEMPERATURE in kwargs:
-            temperature = float(kwargs[ATTR_TEMPERATURE])
+        elif temperature is not None:
             old_temp = zone.target_setpoint
 
-            zone.target_setpoint = temperature
-            # Also update the range around this setpoint
-            zone.target_temp_low = temperature - 2.0
-            zone.target_temp_high = temperature + 2.0
-
-            _LOGGER.info(f"Set {self._zone_id} target temperature: {old_temp:.1f}°F -> {temperature:.1f}°F")
-
-        # Handle mode change if provided
-        if ATTR_HVAC_MODE in kwargs:
-            await self.async_set_hvac_mode(HVACMode(kwargs[ATTR_HVAC_MODE]))
-
-        # Save state and trigger control loop
-        await self._controller._save_state()
-        await self._controller.async_control_loop()
+            if (
+                _same_temperature(temperature, old_temp)
+                and _same_temperature(temperature - 2.0, zone.target_temp_low)
+                and _same_temperature(temperature + 2.0, zone.target_temp_high)
+            ):
+                _LOGGER.debug("%s: Target temperature unchanged", zone_id)
+            else:
+                changed = True
+                zone.target_setpoint = temperature
+                # Also update the range around this setpoint
+                zone.target_temp_low = temperature - 2.0
+                zone.target_temp_high = temperature + 2.0
+
+                _LOGGER.info("Set %s target temperature: %.1f°F -> %.1f°F", zone_id, old_temp, temperature)
+
+        # Handle mode change if provided; applied together with the setpoints below
+        if hvac_mode is not None:
+            changed |= self._apply_hvac_mode(HVACMode(hvac_mode))
+
+        # Nothing to apply if neither the setpoints nor the mode changed
+        if not changed:
+            return
+
+        self._async_commit_change()
+
+    @callback
+    def _async_commit_change(self) -> None:
+        """Persist and apply a user change to this zone"""
+        controller = self._controller
+        # Schedule a debounced save and wake the control loop without waiting for it
+        controller._schedule_save()
+        controller.async_request_control()
 
         # Notify HA that state changed
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
+
+    def _apply_hvac_mode(self, hvac_mode: HVACMode) -> bool:
+        """Update the zone's HVAC mode without saving or writing state; returns whether it changed"""
+        zone = self._zone
+        old_mode = zone.hvac_mode
+        if old_mode == hvac_mode:
+            return False
+        zone.hvac_mode = hvac_mode
+        self._attr_supported_features = self._features_for_mode(hvac_mode)
+        _LOGGER.info("Set %s HVAC mode: %s -> %s", self._zone_id, old_mode, hvac_mode)
+        return True
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode (heat, cool, heat_cool, or off)"""
-        old_mode = self._controller.zones[self._zone_id].hvac_mode
-        self._controller.zones[self._zone_id].hvac_mode = hvac_mode
-        _LOGGER.info(f"Set {self._zone_id} HVAC mode: {old_mode} -> {hvac_mode}")
-
-        # Save state and trigger control loop
-        await self._controller._save_state()
-        await self._controller.async_control_loop()
+        if not self._apply_hvac_mode(hvac_mode):
+            return
 
-        # Notify HA that state changed
-        self.async_write_ha_state()
+        self._async_commit_change()
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set nominal fan speed for this zone"""
-        old_speed = self._controller.zones[self._zone_id].nominal_fan_speed
-        self._controller.zones[self._zone_id].nominal_fan_speed = fan_mode
-        _LOGGER.info(f"Set {self._zone_id} nominal fan speed: {old_speed} -> {fan_mode}")
-
-        # Save state and trigger control loop
-        await self._controller._save_state()
-        await self._controller.async_control_loop()
-
-        # Notify HA that state changed
-        self.async_write_ha_state()
-
-    def update_state(self) -> None:
-        """Called by controller when state changes"""
+        zone = self._zone
+        old_speed = zone.nominal_fan_speed
+        if old_speed == fan_mode:
+            return
+        zone.nominal_fan_speed = fan_mode
+        zone.nominal_fan_level = FAN_SPEED_LEVELS[fan_mode]
+        _LOGGER.info("Set %s nominal fan speed: %s -> %s", self._zone_id, old_speed, fan_mode)
+
+        self._async_commit_change()
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to controller updates for this zone and to the physical entity's state"""
+        self._attr_current_temperature = DualZoneHVACController._temperature_from_state(
+            self.hass.states.get(self._physical_entity)
+        )
+        self.async_on_remove(
+            async_track_state_change_event(
+                self.hass, [self._physical_entity], self._handle_physical_update
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_ZONE_UPDATE.format(self._zone_id),
+                self._handle_controller_update,
+            )
+        )
+
+    @callback
+    def _handle_physical_update(self, event) -> None:
+        """Cache the physical entity's temperature and write state when it changes"""
+        temperature = DualZoneHVACController._temperature_from_state(event.data.get('new_state'))
+        if temperature != self._attr_current_temperature:
+            self._attr_current_temperature = temperature
+            self._async_write_state_if_changed()
+
+    @callback
+    def _handle_controller_update(self) -> None:
+        """Called by controller when this zone's state changes"""
+        self._async_write_state_if_changed()
+
+    def _state_signature(self) -> tuple:
+        """Return the observable state, rounded to the precision it is displayed with"""
+        zone = self._zone
+        return (
+            zone.hvac_mode,
+            zone.nominal_fan_speed,
+            round(zone.target_setpoint, 2),
+            round(zone.target_temp_low, 2),
+            round(zone.target_temp_high, 2),
+            self._attr_current_temperature,
+            round(zone.heating_rate, 3),
+            round(zone.cooling_rate, 3),
+            round(zone.leakage_rate, 3),
+        )
+
+    @callback
+    def _async_write_state_if_changed(self) -> None:
+        """Write state to HA unless nothing observable changed since the last write"""
+        signature = self._state_signature()
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
         self.async_write_ha_state()